@@ -3,19 +3,40 @@ Singular Weather Analytics Web Application
 Professional FastAPI application for weather data analytics and visualization
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.datastructures import Headers
 from fastapi.requests import Request
 import pandas as pd
+import orjson
 import os
+import gzip
+import shutil
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional
 import asyncio
+import time
 import uvicorn
 
+# Warm up matplotlib on the headless Agg backend at import, so worker
+# processes pay its import/backend setup and font lookup once instead of
+# during the first refresh
+os.environ.setdefault("MPLBACKEND", "Agg")
+try:
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    from matplotlib import font_manager
+    # Loads the font cache and memoizes the default font resolution
+    font_manager.findfont(font_manager.FontProperties())
+    import matplotlib.pyplot as plt
+    plt.close(plt.figure())
+except Exception as e:
+    logging.getLogger(__name__).warning(f"Matplotlib warm-up failed: {e}")
+
 # Import our custom modules
 from weather_scraper import WeatherScraper
 from visualizations import WeatherVisualizer
@@ -31,113 +52,333 @@ app = FastAPI(
     description="Professional weather data collection, processing, and visualization platform",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values (gzip;q=0 refuses it)"""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        coding = coding.strip().lower()
+        # An explicit gzip entry wins over the * wildcard
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return wildcard
+
+class TextGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that leaves the PNG chart routes alone; the images are
+    already compressed and recompressing them per request only burns CPU
+    """
+    
+    SKIP_PATH_PREFIXES = ("/charts/raw/", "/static/charts/")
+    
+    async def __call__(self, scope, receive, send):
+        # Starlette only substring-matches "gzip", which would compress for gzip;q=0
+        if scope["type"] == "http" and (
+                scope["path"].startswith(self.SKIP_PATH_PREFIXES)
+                or not _accepts_gzip(Headers(scope=scope).get("accept-encoding", ""))):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Compress HTML and JSON responses; tiny bodies aren't worth the CPU
+app.add_middleware(TextGZipMiddleware, minimum_size=1024)
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Initialize templates
 templates = Jinja2Templates(directory="templates")
 
+# Compile templates once up front; skip the per-render mtime check
+templates.env.auto_reload = False
+for template_name in ("base.html", "dashboard.html", "error.html", "api_data.html",
+                      "chart_view.html", "loading.html"):
+    templates.env.get_template(template_name)
+
 # Global variables to cache data
 cached_weather_data: Optional[pd.DataFrame] = None
 cached_insights: Optional[Dict] = None
 cached_charts: Optional[Dict[str, str]] = None
 last_update_time: Optional[datetime] = None
+last_update_iso: Optional[str] = None
+cached_chart_version: str = ""
+cached_csv_filename: Optional[str] = None
+cached_homepage_html: Optional[str] = None
+cached_api_data_table_html: Optional[str] = None
+cached_api_data_json: Optional[bytes] = None
+
+# Serializes refreshes; repeated triggers within MIN_REFRESH_SECONDS are dropped
+_update_lock = asyncio.Lock()
+_last_update_monotonic: Optional[float] = None
+_pending_update: Optional[asyncio.Task] = None
 
 # Initialize our services
 weather_scraper = WeatherScraper()
 weather_visualizer = WeatherVisualizer()
 
-async def update_weather_data():
+def _to_cached_frame(weather_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a processed weather frame to the dtypes kept in the cache"""
+    # The scraper keeps humidity int64 only when every reading is whole, so pin it
+    # to float here; with integer inference off as well, the JSON output doesn't
+    # change type with the weather
+    if 'humidity' in weather_df:
+        weather_df = weather_df.astype({'humidity': 'float64'})
+    
+    # The cached frame lives for the whole process; Arrow-backed columns keep
+    # strings in one UTF-8 buffer
+    return weather_df.convert_dtypes(dtype_backend="pyarrow", convert_integer=False)
+
+def _update_cache(weather_df: pd.DataFrame, insights: Dict, chart_paths: Dict[str, str],
+                  update_time: datetime):
+    """Swap freshly computed weather data and its derived views into the cache"""
+    global cached_weather_data, cached_insights, cached_charts, last_update_time
+    global last_update_iso, cached_chart_version, cached_csv_filename
+    global cached_homepage_html, cached_api_data_table_html, cached_api_data_json
+    
+    weather_df = _to_cached_frame(weather_df)
+    
+    # Timestamp strings are formatted once here rather than on every request
+    update_iso = update_time.isoformat()
+    payload = _build_weather_payload(weather_df, insights, update_iso)
+    
+    cached_weather_data = weather_df
+    cached_insights = insights
+    cached_charts = chart_paths
+    last_update_time = update_time
+    last_update_iso = update_iso
+    cached_chart_version = f"{update_time.timestamp():.0f}"
+    cached_csv_filename = f"weather_data_{update_time.strftime('%Y%m%d_%H%M%S')}.csv"
+    cached_homepage_html = _render_dashboard(weather_df, insights, update_time)
+    cached_api_data_table_html = _generate_json_table(payload, "Weather Data")
+    cached_api_data_json = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def load_snapshot() -> bool:
     """
-    Background task to update weather data
+    Populate the cache from the on-disk Feather snapshot of the last refresh
+    
+    Returns:
+        True if a snapshot was loaded
     """
-    global cached_weather_data, cached_insights, cached_charts, last_update_time
+    snapshot_path = config.SNAPSHOT_FILE
+    
+    if not os.path.exists(snapshot_path):
+        return False
     
     try:
-        logger.info("Starting weather data update")
-        
-        # Fetch fresh weather data
-        weather_df = weather_scraper.scrape_all_cities()
+        weather_df = pd.read_feather(snapshot_path)
         
         if weather_df.empty:
-            logger.error("No weather data received")
-            return
+            return False
         
-        # Generate insights
         insights = weather_scraper.get_weather_insights(weather_df)
+        chart_paths = weather_visualizer.get_existing_charts()
+        _update_cache(weather_df, insights, chart_paths,
+                      datetime.fromtimestamp(os.path.getmtime(snapshot_path)))
         
-        # Generate visualizations
-        chart_paths = weather_visualizer.generate_all_visualizations(weather_df, insights)
-        
-        # Export to CSV
-        csv_path = config.OUTPUT_CSV_FILE
-        weather_df.to_csv(csv_path, index=False)
-        
-        # Update cache
-        cached_weather_data = weather_df
-        cached_insights = insights
-        cached_charts = chart_paths
-        last_update_time = datetime.now()
-        
-        logger.info(f"Weather data updated successfully for {len(weather_df)} cities")
+        logger.info(f"Loaded weather snapshot for {len(weather_df)} cities from {snapshot_path}")
+        return True
         
     except Exception as e:
-        logger.error(f"Error updating weather data: {e}")
+        logger.error(f"Error loading weather snapshot: {e}")
+        return False
+
+def _export_weather_data(weather_df: pd.DataFrame):
+    """Write the CSV download file, its gzipped copy and the Feather snapshot"""
+    csv_path = weather_scraper.export_to_csv(weather_df)
+    
+    # Pre-compress the download so it is not gzipped again on every request
+    with open(csv_path, "rb") as src, gzip.open(csv_path + ".gz", "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst)
+    
+    weather_df.to_feather(config.SNAPSHOT_FILE)
+
+async def update_weather_data():
+    """
+    Background task to update weather data
+    """
+    global _last_update_monotonic
+    
+    async with _update_lock:
+        if (_last_update_monotonic is not None and
+                time.monotonic() - _last_update_monotonic < config.MIN_REFRESH_SECONDS):
+            logger.info("Skipping weather data update, last refresh is still recent")
+            return
+        
+        try:
+            logger.info("Starting weather data update")
+            
+            # Scraping is natively async; blocking rendering and file I/O run
+            # in worker threads so the event loop keeps serving requests meanwhile
+            
+            # Fetch fresh weather data
+            weather_df = await weather_scraper.scrape_all_cities()
+            
+            if weather_df.empty:
+                logger.error("No weather data received")
+                return
+            
+            # Generate insights
+            insights = await asyncio.to_thread(weather_scraper.get_weather_insights, weather_df)
+            
+            # Generate visualizations
+            chart_paths = await asyncio.to_thread(
+                weather_visualizer.generate_all_visualizations, weather_df, insights
+            )
+            
+            # Export to CSV, plus a Feather snapshot for fast reloads on restart
+            await asyncio.to_thread(_export_weather_data, weather_df)
+            
+            # Update cache
+            _update_cache(weather_df, insights, chart_paths, datetime.now())
+            
+            _last_update_monotonic = time.monotonic()
+            
+            logger.info(f"Weather data updated successfully for {len(weather_df)} cities")
+            
+        except Exception as e:
+            logger.error(f"Error updating weather data: {e}")
+
+def schedule_weather_update() -> asyncio.Task:
+    """
+    Start a weather data refresh as a standalone task
+    
+    Returns:
+        The running refresh task; reused if one is already in flight
+    """
+    global _pending_update
+    
+    if _pending_update is None or _pending_update.done():
+        _pending_update = asyncio.create_task(update_weather_data())
+    
+    return _pending_update
 
 @app.on_event("startup")
 async def startup_event():
     """
-    Initialize the application with fresh weather data
+    Initialize the application with cached or fresh weather data
     """
     logger.info("🚀 Starting Singular Weather Analytics Application")
+    logger.info(f"Event loop: {type(asyncio.get_running_loop()).__name__}")
     
     # Ensure required directories exist
     os.makedirs("templates", exist_ok=True)
     os.makedirs("static", exist_ok=True)
     
-    # Load initial weather data
-    await update_weather_data()
+    # A recent snapshot with all of its charts is served as-is
+    if (load_snapshot() and len(cached_charts) == len(WeatherVisualizer.CHART_FILES)
+            and time.time() - os.path.getmtime(config.SNAPSHOT_FILE) < config.REFRESH_SECONDS):
+        logger.info("Weather snapshot is still fresh, skipping initial scrape")
+        return
+    
+    # Otherwise scrape in the background so the server starts accepting
+    # requests right away, serving the stale snapshot if one was loaded
+    schedule_weather_update()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    Let an in-flight refresh finish so its files aren't left half-written,
+    then stop the chart worker processes
+    """
+    if _pending_update is not None and not _pending_update.done():
+        logger.info("Waiting for in-flight weather data update to finish")
+        await _pending_update
+    
+    weather_visualizer.close()
 
 @app.get("/", response_class=HTMLResponse)
 async def homepage(request: Request):
     """
     Homepage with weather analytics dashboard
     """
-    if cached_weather_data is None:
+    if cached_homepage_html is None:
         return templates.TemplateResponse("error.html", {"request": request})
     
-    # Generate table rows for template
-    table_rows = _generate_table_rows(cached_weather_data)
-    
-    return templates.TemplateResponse("dashboard.html", {
-        "request": request,
-        "insights": cached_insights,
-        "last_update_time": last_update_time,
-        "table_rows": table_rows
-    })
+    return HTMLResponse(cached_homepage_html)
+
+def _render_dashboard(df: pd.DataFrame, insights: Dict, update_time: datetime) -> str:
+    """Render the dashboard page; called once per data refresh"""
+    return templates.get_template("dashboard.html").render(
+        insights=insights,
+        last_update_time=update_time,
+        table_rows=_generate_table_rows(df)
+    )
+
+_TABLE_ROW_COLUMNS = ('city', 'temperature_c', 'temperature_f', 'humidity',
+                      'wind_speed_ms', 'wind_speed_mph')
+_TABLE_ROW_TEMPLATE = (
+    "<tr><td><strong>%s</strong></td><td>%.1f°C</td><td>%.1f°F</td>"
+    "<td>%.0f%%</td><td>%.1f m/s</td><td>%.1f mph</td></tr>"
+)
 
 def _generate_table_rows(df: pd.DataFrame) -> str:
     """Generate HTML table rows from DataFrame"""
     if df is None or df.empty:
         return "<tr><td colspan='6'>No data available</td></tr>"
     
-    rows = []
-    for _, row in df.iterrows():
-        rows.append(f"""
-        <tr>
-            <td><strong>{row['city']}</strong></td>
-            <td>{row['temperature_c']:.1f}°C</td>
-            <td>{row['temperature_f']:.1f}°F</td>
-            <td>{row['humidity']:.0f}%</td>
-            <td>{row['wind_speed_ms']:.1f} m/s</td>
-            <td>{row['wind_speed_mph']:.1f} mph</td>
-        </tr>
-        """)
-    
-    return "".join(rows)
+    # Pull each column out as a plain list once, then fill a fixed %-template
+    # per row; much cheaper than boxing every row into a Series. Missing
+    # values come back as NaN so Arrow-backed nulls still format.
+    columns = [df[col].to_numpy(dtype=object, na_value=float("nan")).tolist()
+               for col in _TABLE_ROW_COLUMNS]
+    
+    return "".join([_TABLE_ROW_TEMPLATE % row for row in zip(*columns)])
+
+def _build_weather_payload(df: pd.DataFrame, insights: Dict,
+                           last_updated: Optional[str]) -> Dict:
+    """Assemble the weather data payload shared by the data endpoints"""
+    return {
+        "data": df.to_dict('records'),
+        "insights": insights,
+        "last_updated": last_updated,
+        "total_cities": len(df)
+    }
+
+def _generate_json_table(data, title):
+    """Render a nested weather payload as HTML tables"""
+    if isinstance(data, dict):
+        rows = ""
+        for key, value in data.items():
+            if isinstance(value, dict):
+                nested_table = _generate_json_table(value, key)
+                rows += f"<tr><td class='key'>{key}</td><td>{nested_table}</td></tr>"
+            elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
+                # Table for list of objects
+                if key == "data":  # Main weather data
+                    table_html = "<table class='data-table'><thead><tr>"
+                    if value:
+                        for col in value[0].keys():
+                            table_html += f"<th>{col}</th>"
+                        table_html += "</tr></thead><tbody>"
+                        for row in value:
+                            table_html += "<tr>"
+                            for col_val in row.values():
+                                formatted_val = f"{col_val:.2f}" if isinstance(col_val, float) else str(col_val)
+                                table_html += f"<td>{formatted_val}</td>"
+                            table_html += "</tr>"
+                        table_html += "</tbody></table>"
+                    rows += f"<tr><td class='key'>{key}</td><td>{table_html}</td></tr>"
+                else:
+                    rows += f"<tr><td class='key'>{key}</td><td class='value'>{str(value)}</td></tr>"
+            else:
+                formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
+                rows += f"<tr><td class='key'>{key}</td><td class='value'>{formatted_value}</td></tr>"
+        return f"<table class='json-table'><tbody>{rows}</tbody></table>"
+    return str(data)
 
 @app.get("/api/data")
 async def get_weather_data_page(request: Request):
@@ -147,52 +388,11 @@ async def get_weather_data_page(request: Request):
     if cached_weather_data is None:
         raise HTTPException(status_code=503, detail="Weather data not available")
     
-    # Generate formatted data table
-    def generate_json_table(data, title):
-        if isinstance(data, dict):
-            rows = ""
-            for key, value in data.items():
-                if isinstance(value, dict):
-                    nested_table = generate_json_table(value, key)
-                    rows += f"<tr><td class='key'>{key}</td><td>{nested_table}</td></tr>"
-                elif isinstance(value, list) and len(value) > 0 and isinstance(value[0], dict):
-                    # Table for list of objects
-                    if key == "data":  # Main weather data
-                        table_html = "<table class='data-table'><thead><tr>"
-                        if value:
-                            for col in value[0].keys():
-                                table_html += f"<th>{col}</th>"
-                            table_html += "</tr></thead><tbody>"
-                            for row in value:
-                                table_html += "<tr>"
-                                for col_val in row.values():
-                                    formatted_val = f"{col_val:.2f}" if isinstance(col_val, float) else str(col_val)
-                                    table_html += f"<td>{formatted_val}</td>"
-                                table_html += "</tr>"
-                            table_html += "</tbody></table>"
-                        rows += f"<tr><td class='key'>{key}</td><td>{table_html}</td></tr>"
-                    else:
-                        rows += f"<tr><td class='key'>{key}</td><td class='value'>{str(value)}</td></tr>"
-                else:
-                    formatted_value = f"{value:.2f}" if isinstance(value, float) else str(value)
-                    rows += f"<tr><td class='key'>{key}</td><td class='value'>{formatted_value}</td></tr>"
-            return f"<table class='json-table'><tbody>{rows}</tbody></table>"
-        return str(data)
-    
-    weather_data = {
-        "data": cached_weather_data.to_dict('records'),
-        "insights": cached_insights,
-        "last_updated": last_update_time.isoformat() if last_update_time else None,
-        "total_cities": len(cached_weather_data)
-    }
-    
-    data_table = generate_json_table(weather_data, "Weather Data")
-    
     return templates.TemplateResponse("api_data.html", {
         "request": request,
         "last_update_time": last_update_time,
         "total_cities": len(cached_weather_data),
-        "data_table": data_table
+        "data_table": cached_api_data_table_html
     })
 
 @app.get("/api/data/raw")
@@ -200,15 +400,10 @@ async def get_weather_data_raw():
     """
     API endpoint to get current weather data as raw JSON
     """
-    if cached_weather_data is None:
+    if cached_api_data_json is None:
         raise HTTPException(status_code=503, detail="Weather data not available")
     
-    return {
-        "data": cached_weather_data.to_dict('records'),
-        "insights": cached_insights,
-        "last_updated": last_update_time.isoformat() if last_update_time else None,
-        "total_cities": len(cached_weather_data)
-    }
+    return Response(content=cached_api_data_json, media_type="application/json")
 
 @app.get("/api/insights")
 async def get_weather_insights():
@@ -245,7 +440,8 @@ async def get_chart(chart_name: str, request: Request):
     return templates.TemplateResponse("chart_view.html", {
         "request": request,
         "chart_name": chart_name,
-        "chart_title": chart_title
+        "chart_title": chart_title,
+        "chart_version": cached_chart_version
     })
 
 @app.get("/charts/raw/{chart_name}")
@@ -261,10 +457,16 @@ async def get_raw_chart(chart_name: str):
     if not os.path.exists(chart_path):
         raise HTTPException(status_code=404, detail="Chart file not found")
     
-    return FileResponse(chart_path, media_type="image/png")
+    # Charts only change on refresh and the page links them with a version
+    # query string, so browsers may reuse them without revalidating
+    return FileResponse(
+        chart_path,
+        media_type="image/png",
+        headers={"Cache-Control": f"public, max-age={config.CHART_CACHE_SECONDS}"}
+    )
 
 @app.get("/download/csv")
-async def download_csv():
+async def download_csv(request: Request):
     """
     Download weather data as CSV file
     """
@@ -273,71 +475,98 @@ async def download_csv():
     if not os.path.exists(csv_path):
         raise HTTPException(status_code=404, detail="CSV file not found")
     
+    filename = cached_csv_filename or f"weather_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    gz_path = csv_path + ".gz"
+    
+    # Serve the pre-compressed copy when it is current and the client accepts it
+    if (_accepts_gzip(request.headers.get("accept-encoding", "")) and os.path.exists(gz_path)
+            and os.path.getmtime(gz_path) >= os.path.getmtime(csv_path)):
+        return FileResponse(
+            gz_path,
+            media_type="text/csv",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            filename=filename
+        )
+    
     return FileResponse(
         csv_path, 
         media_type="text/csv", 
-        filename=f"weather_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        headers={"Vary": "Accept-Encoding"},
+        filename=filename
     )
 
 @app.post("/update")
-async def update_data(background_tasks: BackgroundTasks):
+async def update_data():
     """
     Trigger a manual update of weather data
     """
-    background_tasks.add_task(update_weather_data)
+    schedule_weather_update()
     
-    return JSONResponse({
+    return {
         "message": "Weather data update initiated",
         "status": "success",
         "timestamp": datetime.now().isoformat()
-    })
+    }
 
 @app.get("/update")
-async def update_data_get(background_tasks: BackgroundTasks, request: Request):
+async def update_data_get(request: Request):
     """
     GET endpoint for updating data (redirects to homepage)
     """
-    background_tasks.add_task(update_weather_data)
+    schedule_weather_update()
     
     return templates.TemplateResponse("loading.html", {"request": request})
 
+# Health payload skeleton; only the dynamic fields are refreshed per request
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "timestamp": None,
+    "data_available": False,
+    "last_update": None
+}
+
 @app.get("/health")
 async def health_check():
     """
     Health check endpoint for monitoring
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "data_available": cached_weather_data is not None,
-        "last_update": last_update_time.isoformat() if last_update_time else None
-    }
+    _HEALTH_PAYLOAD["timestamp"] = datetime.now().isoformat()
+    _HEALTH_PAYLOAD["data_available"] = cached_weather_data is not None
+    _HEALTH_PAYLOAD["last_update"] = last_update_iso
+    
+    # Encoded immediately with no await in between, so sharing the dict is safe
+    return ORJSONResponse(_HEALTH_PAYLOAD)
+
+# The city list is fixed at runtime, so encode it once
+_CITIES_BYTES = orjson.dumps({"cities": [city.as_dict() for city in config.CITIES]})
 
 @app.get("/api/cities")
 async def get_cities():
     """
     Get list of monitored cities
     """
-    return {"cities": config.CITIES}
+    return Response(content=_CITIES_BYTES, media_type="application/json")
 
-@app.get("/favicon.ico")
-async def favicon():
-    """
-    Serve favicon to prevent 404 errors
-    """
-    # Simple weather-themed favicon (cloud emoji as SVG)
-    favicon_svg = """<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+# Simple weather-themed favicon (cloud emoji as SVG), built once at import
+_FAVICON_BYTES = b"""<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
         <circle cx="30" cy="30" r="20" fill="#87CEEB" opacity="0.8"/>
         <circle cx="50" cy="25" r="25" fill="#B0E0E6" opacity="0.9"/>
         <circle cx="70" cy="30" r="18" fill="#87CEEB" opacity="0.8"/>
         <ellipse cx="50" cy="45" rx="35" ry="15" fill="#E6F3FF"/>
     </svg>"""
-    
-    return Response(
-        content=favicon_svg,
-        media_type="image/svg+xml",
-        headers={"Cache-Control": "max-age=86400"}  # Cache for 24 hours
-    )
+
+_FAVICON_RESPONSE = Response(
+    content=_FAVICON_BYTES,
+    media_type="image/svg+xml",
+    headers={"Cache-Control": "max-age=86400, public, immutable"}  # Cache for 24 hours
+)
+
+@app.get("/favicon.ico")
+async def favicon():
+    """
+    Serve favicon to prevent 404 errors
+    """
+    return _FAVICON_RESPONSE
 
 if __name__ == "__main__":
     print("🌤️ Starting Singular Weather Analytics Server")
@@ -349,5 +578,8 @@ if __name__ == "__main__":
         host=config.HOST,
         port=config.PORT,
         reload=config.DEBUG,
+        # "auto" picks uvloop where it is installed (not on Windows)
+        loop="auto",
+        http="httptools",
         log_level="info"
     ) 
\ No newline at end of file
@@ -4,47 +4,158 @@ Designed for Singular - Marketing Analytics & Attribution Platform
 """
 
 import os
-from typing import List, Dict
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Any, Dict, NamedTuple, Tuple
+import numpy as np
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+class City(NamedTuple):
+    """Packed city record; the dict-style key names are kept as aliases"""
+    name: str
+    lat: float
+    lon: float
+    
+    @property
+    def City(self) -> str:
+        return self.name
+    
+    @property
+    def Latitude(self) -> float:
+        return self.lat
+    
+    @property
+    def Longitude(self) -> float:
+        return self.lon
+    
+    def __getitem__(self, key):
+        # Back-compat for city["City"] / city["Latitude"] lookups
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the City/Latitude/Longitude dict form used by the API"""
+        return {"City": self.name, "Latitude": self.lat, "Longitude": self.lon}
+
+# Predefined cities with coordinates (as per exercise requirements)
+_DEFAULT_CITIES: Tuple[City, ...] = (
+    City("New York", 40.7128, -74.0060),
+    City("Tokyo", 35.6895, 139.6917),
+    City("London", 51.5074, -0.1278),
+    City("Paris", 48.8566, 2.3522),
+    City("Berlin", 52.5200, 13.4050),
+    City("Sydney", -33.8688, 151.2093),
+    City("Mumbai", 19.0760, 72.8777),
+    City("Cape Town", -33.9249, 18.4241),
+    City("Moscow", 55.7558, 37.6173),
+    City("Rio de Janeiro", -22.9068, -43.1729)
+)
+
+def _snapshot() -> Dict[str, Any]:
+    """
+    Read all environment-driven settings in a single pass
+    
+    Returns:
+        Dictionary of Config field values
+    """
+    global _DOTENV_LOADED
+    
+    # Load environment variables; the flag lives in the module globals, so it
+    # survives importlib.reload() and .env is only parsed once per process
+    if not globals().get("_DOTENV_LOADED"):
+        load_dotenv()
+        _DOTENV_LOADED = True
+    
+    env = os.environ
+    return {
+        # API Configuration
+        "OPEN_METEO_BASE_URL": env.get("OPEN_METEO_BASE_URL", "https://api.open-meteo.com/v1/forecast"),
+        "MAX_CONCURRENT_REQUESTS": int(env.get("MAX_CONCURRENT_REQUESTS", "16")),
+        "REQUESTS_PER_SECOND": int(env.get("REQUESTS_PER_SECOND", "10")),
+        
+        # Server Configuration
+        "HOST": env.get("HOST", "0.0.0.0"),
+        "PORT": int(env.get("PORT", "8000")),
+        "DEBUG": env.get("DEBUG", "true").lower() == "true",
+        
+        # Data Configuration
+        "OUTPUT_CSV_FILE": env.get("OUTPUT_CSV_FILE", "weather_data.csv"),
+        "CSV_ENGINE": env.get("CSV_ENGINE", "pyarrow"),
+        "SNAPSHOT_FILE": env.get("SNAPSHOT_FILE", "weather_data.feather"),
+        "CHARTS_DIR": env.get("CHARTS_DIR", "static/charts"),
+        "CHART_DPI": int(env.get("CHART_DPI", "150")),
+        # Chart worker processes per server worker. Opt-in: the default of 1 renders
+        # in-process, which keeps memory flat on small instances running several
+        # server workers; each extra process costs roughly 100 MB
+        "CHART_PROCESSES": int(env.get("CHART_PROCESSES", "1")),
+        "CHART_TIMEOUT_SECONDS": int(env.get("CHART_TIMEOUT_SECONDS", "60")),
+        
+        # Refresh Configuration
+        "MIN_REFRESH_SECONDS": int(env.get("MIN_REFRESH_SECONDS", "30")),
+        "REFRESH_SECONDS": int(env.get("REFRESH_SECONDS", "900")),
+        "CHART_CACHE_SECONDS": int(env.get("CHART_CACHE_SECONDS", "300"))
+    }
+
+@lru_cache(maxsize=None)
+def _ensure_directories(charts_dir: str):
+    """
+    Create the static and charts directories once per process
+    
+    Args:
+        charts_dir: Charts output directory
+    """
+    os.makedirs(charts_dir, exist_ok=True)
+    os.makedirs("static", exist_ok=True)
 
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration settings"""
+    """Application configuration settings, resolved once at import"""
     
     # API Configuration
-    OPEN_METEO_BASE_URL = os.getenv("OPEN_METEO_BASE_URL", "https://api.open-meteo.com/v1/forecast")
+    OPEN_METEO_BASE_URL: str
+    MAX_CONCURRENT_REQUESTS: int
+    REQUESTS_PER_SECOND: int
     
     # Server Configuration
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", "8000"))
-    DEBUG = os.getenv("DEBUG", "true").lower() == "true"
+    HOST: str
+    PORT: int
+    DEBUG: bool
     
     # Data Configuration
-    OUTPUT_CSV_FILE = os.getenv("OUTPUT_CSV_FILE", "weather_data.csv")
-    CHARTS_DIR = os.getenv("CHARTS_DIR", "static/charts")
+    OUTPUT_CSV_FILE: str
+    CSV_ENGINE: str
+    SNAPSHOT_FILE: str
+    CHARTS_DIR: str
+    CHART_DPI: int
+    CHART_PROCESSES: int
+    CHART_TIMEOUT_SECONDS: int
+    
+    # Refresh Configuration
+    MIN_REFRESH_SECONDS: int
+    REFRESH_SECONDS: int
+    CHART_CACHE_SECONDS: int
     
     # Predefined cities with coordinates (as per exercise requirements)
-    CITIES: List[Dict[str, any]] = [
-        {"City": "New York", "Latitude": 40.7128, "Longitude": -74.0060},
-        {"City": "Tokyo", "Latitude": 35.6895, "Longitude": 139.6917},
-        {"City": "London", "Latitude": 51.5074, "Longitude": -0.1278},
-        {"City": "Paris", "Latitude": 48.8566, "Longitude": 2.3522},
-        {"City": "Berlin", "Latitude": 52.5200, "Longitude": 13.4050},
-        {"City": "Sydney", "Latitude": -33.8688, "Longitude": 151.2093},
-        {"City": "Mumbai", "Latitude": 19.0760, "Longitude": 72.8777},
-        {"City": "Cape Town", "Latitude": -33.9249, "Longitude": 18.4241},
-        {"City": "Moscow", "Latitude": 55.7558, "Longitude": 37.6173},
-        {"City": "Rio de Janeiro", "Latitude": -22.9068, "Longitude": -43.1729}
-    ]
-    
-    @classmethod
-    def ensure_directories(cls):
-        """Ensure required directories exist"""
-        os.makedirs(cls.CHARTS_DIR, exist_ok=True)
-        os.makedirs("static", exist_ok=True)
+    CITIES: Tuple[City, ...] = _DEFAULT_CITIES
+    
+    # Column-wise (SoA) view of CITIES for batched requests and vectorized math
+    CITY_NAMES: Tuple[str, ...] = field(init=False)
+    LATS: np.ndarray = field(init=False, repr=False)
+    LONS: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Derive the parallel city arrays from CITIES"""
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, "CITY_NAMES", tuple(c.name for c in self.CITIES))
+        object.__setattr__(self, "LATS", np.array([c.lat for c in self.CITIES], dtype=np.float64))
+        object.__setattr__(self, "LONS", np.array([c.lon for c in self.CITIES], dtype=np.float64))
+    
+    def ensure_directories(self):
+        """Ensure required directories exist (cached, so repeat calls are free)"""
+        # Keyed on the path because the config itself holds unhashable arrays
+        _ensure_directories(self.CHARTS_DIR)
 
 # Initialize configuration
-config = Config()
-config.ensure_directories() 
\ No newline at end of file
+config = Config(**_snapshot())
+config.ensure_directories()
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the Singular Weather Analytics test suite
+"""
+
+import asyncio
+import pytest
+
+from weather_scraper import WeatherScraper
+
+@pytest.fixture(scope="session")
+def scraper():
+    """Single WeatherScraper (and HTTP session) shared by the whole test session"""
+    weather_scraper = WeatherScraper()
+    yield weather_scraper
+    weather_scraper.session.close()
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for every async test instead of a fresh loop per test"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
\ No newline at end of file
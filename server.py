@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Single startup script for Singular Weather Analytics
+Runs the app under uvicorn (default) or gunicorn with uvicorn workers
+"""
+
+import argparse
+import os
+import sys
+
+def parse_args():
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Start the Singular Weather Analytics server")
+    parser.add_argument("--mode", choices=["uvicorn", "gunicorn"], default="uvicorn",
+                        help="server runner (default: uvicorn)")
+    # Get port from environment or default to 10000 (Render's default)
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 10000)),
+                        help="port to bind (default: $PORT or 10000)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="number of worker processes (default: 4)")
+    return parser.parse_args()
+
+def run_uvicorn(port: int, workers: int):
+    """Run uvicorn in-process on uvloop (where available) and httptools"""
+    import uvicorn
+    
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=port,
+        workers=workers,
+        # "auto" picks uvloop where it is installed (not on Windows)
+        loop="auto",
+        http="httptools",
+        log_level="info"
+    )
+
+def run_gunicorn(port: int, workers: int):
+    """Replace this process with gunicorn managing uvicorn workers"""
+    args = [
+        sys.executable, '-m', 'gunicorn', 'app:app',
+        '--workers', str(workers),
+        '--worker-class', 'uvicorn.workers.UvicornWorker',
+        '--bind', f'0.0.0.0:{port}',
+        '--log-level', 'info'
+    ]
+    print(f"Command: {' '.join(args)}")
+    
+    # exec replaces this process, so buffered output must be written first;
+    # running gunicorn from the current interpreter avoids a PATH lookup
+    sys.stdout.flush()
+    os.execv(sys.executable, args)
+
+def main():
+    args = parse_args()
+    
+    print(f"🌤️ Starting Singular Weather Analytics on port {args.port}")
+    print(f"Python version: {sys.version}")
+    print(f"📍 Using {args.mode} with {args.workers} worker(s)")
+    
+    if args.mode == "gunicorn":
+        run_gunicorn(args.port, args.workers)
+    else:
+        run_uvicorn(args.port, args.workers)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -5,17 +5,25 @@ Tests all major components: data collection, processing, visualization, and web
 
 import pytest
 import asyncio
+import contextlib
+import aiohttp
+from aiohttp import web
 import pandas as pd
+import numpy as np
+import pyarrow.csv as pacsv
+import matplotlib
+import matplotlib.pyplot as plt
 import os
 import sys
+import gzip
+import signal
+import dataclasses
 from datetime import datetime
 import logging
 
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
 # Import our modules
-from weather_scraper import WeatherScraper
+from weather_scraper import WeatherScraper, _RateLimiter
+import visualizations
 from visualizations import WeatherVisualizer
 from config import config
 import app
@@ -24,12 +32,76 @@ import app
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Sample data built once at import and shared read-only across tests
+SAMPLE_DF = pd.DataFrame({
+    'city': ['New York', 'Tokyo', 'London'],
+    'temperature_c': [15, 20, 12],
+    'temperature_f': [59, 68, 53.6],
+    'humidity': [70, 60, 80],
+    'wind_speed_ms': [5, 3, 4],
+    'wind_speed_mph': [11.2, 6.7, 8.9]
+})
+
+SAMPLE_INSIGHTS = {
+    'total_cities': 3,
+    'data_collection_time': datetime.now().isoformat(),
+    'temperature_stats': {
+        'hottest_city': 'Tokyo',
+        'coldest_city': 'London',
+        'avg_temperature_c': 15.7,
+        'avg_temperature_f': 60.2
+    },
+    'humidity_stats': {
+        'most_humid_city': 'London',
+        'least_humid_city': 'Tokyo',
+        'avg_humidity': 70.0
+    },
+    'wind_stats': {
+        'windiest_city': 'New York',
+        'calmest_city': 'Tokyo',
+        'avg_wind_speed_mph': 8.9
+    }
+}
+
+# Sample data with multiple cities for insights generation
+INSIGHTS_SAMPLE_DF = pd.DataFrame({
+    'city': ['Hot City', 'Cold City', 'Humid City'],
+    'temperature_c': [30.0, 5.0, 20.0],
+    'temperature_f': [86.0, 41.0, 68.0],
+    'humidity': [40, 60, 90],
+    'wind_speed_ms': [3.0, 8.0, 2.0],
+    'wind_speed_mph': [6.7, 17.9, 4.5]
+})
+
+def _current_payload(temperature: float, humidity: float) -> dict:
+    """Open-Meteo current= response for one location"""
+    return {'current': {
+        'time': '2024-01-01T12:00', 'temperature_2m': temperature,
+        'relative_humidity_2m': humidity, 'wind_speed_10m': 4.2
+    }}
+
+@contextlib.asynccontextmanager
+async def open_meteo_stub(handler):
+    """Serve handler as a local Open-Meteo forecast endpoint and yield its URL"""
+    server_app = web.Application()
+    server_app.router.add_get('/v1/forecast', handler)
+    runner = web.AppRunner(server_app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    try:
+        port = site._server.sockets[0].getsockname()[1]
+        yield f'http://127.0.0.1:{port}/v1/forecast'
+    finally:
+        await runner.cleanup()
+
 class TestWeatherScraper:
     """Test weather data collection and processing"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.scraper = WeatherScraper()
+    @pytest.fixture(autouse=True)
+    def _use_scraper(self, scraper):
+        """Attach the shared session-scoped scraper"""
+        self.scraper = scraper
     
     def test_weather_scraper_initialization(self):
         """Test that weather scraper initializes correctly"""
@@ -37,6 +109,7 @@ class TestWeatherScraper:
         assert hasattr(self.scraper, 'session')
         logger.info("✅ Weather scraper initialization test passed")
     
+    @pytest.mark.network
     def test_single_city_data_fetch(self):
         """Test fetching weather data for a single city"""
         # Test with New York coordinates
@@ -52,9 +125,11 @@ class TestWeatherScraper:
         else:
             logger.warning("⚠️ Single city data fetch returned None (network issue?)")
     
-    def test_all_cities_data_collection(self):
+    @pytest.mark.network
+    @pytest.mark.asyncio
+    async def test_all_cities_data_collection(self):
         """Test collecting data for all configured cities"""
-        weather_df = self.scraper.scrape_all_cities()
+        weather_df = await self.scraper.scrape_all_cities()
         
         if not weather_df.empty:
             # Verify DataFrame structure
@@ -75,17 +150,122 @@ class TestWeatherScraper:
         else:
             logger.warning("⚠️ All cities data collection returned empty DataFrame")
     
+    def test_weather_response_parsing(self):
+        """Test parsing both the current= block and the legacy current_weather/hourly shape"""
+        params = self.scraper._build_params(40.7128, -74.0060)
+        assert params['current'] == 'temperature_2m,relative_humidity_2m,wind_speed_10m'
+        assert params['wind_speed_unit'] == 'ms'
+        
+        current = self.scraper._parse_weather_response({'current': {
+            'time': '2024-01-01T12:00', 'temperature_2m': 21.5,
+            'relative_humidity_2m': 55, 'wind_speed_10m': 4.2
+        }}, 40.7128, -74.0060, "New York")
+        assert current == {
+            'city': "New York", 'latitude': 40.7128, 'longitude': -74.0060,
+            'temperature_c': 21.5, 'humidity': 55, 'wind_speed_ms': 4.2,
+            'timestamp': '2024-01-01T12:00'
+        }
+        
+        legacy = self.scraper._parse_weather_response({
+            'current_weather': {'time': '2024-01-01T12:00', 'temperature': 18.0, 'windspeed': 3.1},
+            'hourly': {'relative_humidity_2m': [64, 66, 70]}
+        }, 35.6895, 139.6917, "Tokyo")
+        assert legacy['temperature_c'] == 18.0
+        assert legacy['humidity'] == 64
+        assert legacy['wind_speed_ms'] == 3.1
+        assert legacy['timestamp'] == '2024-01-01T12:00'
+        
+        # Missing humidity series leaves the reading empty instead of failing
+        no_hourly = self.scraper._parse_weather_response(
+            {'current_weather': {'temperature': 18.0, 'windspeed': 3.1}}, 35.6895, 139.6917, "Tokyo"
+        )
+        assert no_hourly['humidity'] is None
+        assert no_hourly['temperature_c'] == 18.0
+        
+        logger.info("✅ Weather response parsing test passed")
+    
+    @pytest.mark.asyncio
+    async def test_async_fetch_retries_server_errors(self, monkeypatch):
+        """Test that the aiohttp path retries a transient 5xx instead of dropping the city"""
+        calls = []
+        
+        async def handler(request):
+            calls.append(request.query['latitude'])
+            if len(calls) == 1:
+                return web.Response(status=500)
+            return web.json_response(_current_payload(21.5, 55))
+        
+        monkeypatch.setattr(self.scraper, 'RETRY_BACKOFF', 0)
+        async with open_meteo_stub(handler) as url:
+            monkeypatch.setattr(self.scraper, 'base_url', url)
+            async with aiohttp.ClientSession() as http:
+                weather = await self.scraper._fetch_weather_data_async(http, 40.7128, -74.0060, "New York")
+        
+        assert len(calls) == 2
+        assert weather['temperature_c'] == 21.5
+        assert weather['humidity'] == 55
+        
+        logger.info("✅ Async fetch retry test passed")
+    
+    @pytest.mark.asyncio
+    async def test_cities_fetched_in_one_request(self, monkeypatch):
+        """Test that all configured cities go out as one multi-location request"""
+        calls = []
+        
+        async def handler(request):
+            latitudes = request.query['latitude'].split(',')
+            calls.append(latitudes)
+            # Temperature encodes the position so the result order can be checked
+            return web.json_response([_current_payload(float(i), 50) for i in range(len(latitudes))])
+        
+        async with open_meteo_stub(handler) as url:
+            monkeypatch.setattr(self.scraper, 'base_url', url)
+            weather_df = await self.scraper.scrape_all_cities()
+        
+        assert len(calls) == 1
+        assert calls[0] == [str(lat) for lat in config.LATS]
+        by_city = weather_df.set_index('city')['temperature_c']
+        assert [by_city[name] for name in config.CITY_NAMES] == list(map(float, range(len(config.CITIES))))
+        
+        logger.info("✅ Batched fetch test passed")
+    
+    @pytest.mark.asyncio
+    async def test_humidity_kept_integral_only_when_whole(self, monkeypatch):
+        """Test that fractional humidity readings are not truncated to int"""
+        cities = [config.CITIES[0], config.CITIES[1]]
+        readings = []
+        
+        async def handler(request):
+            return web.json_response([_current_payload(20.0, humidity) for humidity in readings])
+        
+        async with open_meteo_stub(handler) as url:
+            monkeypatch.setattr(self.scraper, 'base_url', url)
+            
+            readings[:] = [55, 60]
+            whole = await self.scraper.scrape_all_cities(cities)
+            assert whole['humidity'].dtype == np.int64
+            
+            readings[:] = [55.5, 60]
+            fractional = await self.scraper.scrape_all_cities(cities)
+            assert fractional['humidity'].dtype == np.float64
+            assert 55.5 in fractional['humidity'].tolist()
+        
+        logger.info("✅ Humidity dtype test passed")
+    
     def test_data_processing(self):
         """Test data processing and conversions"""
-        # Create sample data
+        # Create sample data matching the number of configured cities
+        n_cities = len(config.CITIES)
+        temperature_c = np.linspace(-10, 40, n_cities)
+        wind_speed_ms = np.linspace(0, 15, n_cities)
         sample_data = pd.DataFrame({
-            'city': ['Test City'],
-            'temperature_c': [20.0],
-            'humidity': [65],
-            'wind_speed_ms': [5.0],
-            'latitude': [40.0],
-            'longitude': [-74.0],
-            'timestamp': [datetime.now().isoformat()]
+            'city': list(config.CITY_NAMES),
+            'temperature_c': temperature_c,
+            'humidity': np.linspace(20, 100, n_cities).astype(int),
+            'wind_speed_ms': wind_speed_ms,
+            'latitude': config.LATS,
+            'longitude': config.LONS,
+            'timestamp': [datetime.now().isoformat()] * n_cities
         })
         
         processed_df = self.scraper.process_weather_data(sample_data)
@@ -93,31 +273,18 @@ class TestWeatherScraper:
         # Verify conversions
         assert 'temperature_f' in processed_df.columns
         assert 'wind_speed_mph' in processed_df.columns
+        assert len(processed_df) == n_cities
         
-        # Test conversion accuracy
-        temp_f = processed_df['temperature_f'].iloc[0]
-        expected_f = 20 * 9/5 + 32  # 68°F
-        assert abs(temp_f - expected_f) < 0.1
-        
-        wind_mph = processed_df['wind_speed_mph'].iloc[0]
-        expected_mph = 5.0 * 2.237  # ~11.2 mph
-        assert abs(wind_mph - expected_mph) < 0.1
+        # Test conversion accuracy (outputs are re-sorted and rounded to one decimal)
+        processed_df = processed_df.set_index('city').loc[list(config.CITY_NAMES)]
+        assert np.allclose(processed_df['temperature_f'].to_numpy(), temperature_c * 9/5 + 32, atol=0.05)
+        assert np.allclose(processed_df['wind_speed_mph'].to_numpy(), wind_speed_ms * 2.237, atol=0.05)
         
         logger.info("✅ Data processing test passed")
     
     def test_insights_generation(self):
         """Test business intelligence insights generation"""
-        # Create sample data with multiple cities
-        sample_data = pd.DataFrame({
-            'city': ['Hot City', 'Cold City', 'Humid City'],
-            'temperature_c': [30.0, 5.0, 20.0],
-            'temperature_f': [86.0, 41.0, 68.0],
-            'humidity': [40, 60, 90],
-            'wind_speed_ms': [3.0, 8.0, 2.0],
-            'wind_speed_mph': [6.7, 17.9, 4.5]
-        })
-        
-        insights = self.scraper.get_weather_insights(sample_data)
+        insights = self.scraper.get_weather_insights(INSIGHTS_SAMPLE_DF)
         
         # Verify insights structure
         assert 'temperature_stats' in insights
@@ -131,44 +298,39 @@ class TestWeatherScraper:
         assert insights['humidity_stats']['most_humid_city'] == 'Humid City'
         
         logger.info("✅ Insights generation test passed")
+    
+    def test_rate_limiter_allows_burst(self):
+        """Test that requests within the rate limit are not delayed"""
+        limiter = _RateLimiter(calls=10, period=1.0)
+        delays = [limiter.reserve() for _ in range(12)]
+        
+        # The first burst goes out immediately, the overflow waits one period
+        assert delays[:10] == [0.0] * 10
+        assert all(0.9 < delay <= 1.0 for delay in delays[10:])
+        
+        logger.info("✅ Rate limiter test passed")
 
 class TestWeatherVisualizer:
     """Test weather data visualization"""
     
-    def setup_method(self):
-        """Setup for each test"""
-        self.visualizer = WeatherVisualizer()
-        
-        # Create sample data for testing
-        self.sample_df = pd.DataFrame({
-            'city': ['New York', 'Tokyo', 'London'],
-            'temperature_c': [15, 20, 12],
-            'temperature_f': [59, 68, 53.6],
-            'humidity': [70, 60, 80],
-            'wind_speed_ms': [5, 3, 4],
-            'wind_speed_mph': [11.2, 6.7, 8.9]
-        })
-        
-        self.sample_insights = {
-            'total_cities': 3,
-            'data_collection_time': datetime.now().isoformat(),
-            'temperature_stats': {
-                'hottest_city': 'Tokyo',
-                'coldest_city': 'London',
-                'avg_temperature_c': 15.7,
-                'avg_temperature_f': 60.2
-            },
-            'humidity_stats': {
-                'most_humid_city': 'London',
-                'least_humid_city': 'Tokyo',
-                'avg_humidity': 70.0
-            },
-            'wind_stats': {
-                'windiest_city': 'New York',
-                'calmest_city': 'Tokyo',
-                'avg_wind_speed_mph': 8.9
-            }
-        }
+    @pytest.fixture(scope="class")
+    def visualizer(self):
+        """One visualizer per class so matplotlib backend/font setup happens once"""
+        matplotlib.use('Agg')
+        matplotlib.rcParams['figure.max_open_warning'] = 0
+        weather_visualizer = WeatherVisualizer()
+        yield weather_visualizer
+        weather_visualizer.close()
+    
+    @pytest.fixture(autouse=True)
+    def _use_fixtures(self, visualizer):
+        """Attach the shared visualizer and sample data, release figures after each test"""
+        self.visualizer = visualizer
+        # Charts only read the sample data, so the module-level objects are shared as-is
+        self.sample_df = SAMPLE_DF
+        self.sample_insights = SAMPLE_INSIGHTS
+        yield
+        plt.close('all')
     
     def test_visualizer_initialization(self):
         """Test visualizer initialization"""
@@ -176,6 +338,7 @@ class TestWeatherVisualizer:
         assert os.path.exists(self.visualizer.charts_dir)
         logger.info("✅ Visualizer initialization test passed")
     
+    @pytest.mark.slow
     def test_temperature_chart_creation(self):
         """Test temperature comparison chart creation"""
         chart_path = self.visualizer.create_temperature_comparison_chart(self.sample_df)
@@ -190,6 +353,7 @@ class TestWeatherVisualizer:
         
         logger.info("✅ Temperature chart creation test passed")
     
+    @pytest.mark.slow
     def test_humidity_wind_chart_creation(self):
         """Test humidity and wind analysis chart creation"""
         chart_path = self.visualizer.create_humidity_wind_analysis(self.sample_df)
@@ -199,6 +363,7 @@ class TestWeatherVisualizer:
         
         logger.info("✅ Humidity and wind chart creation test passed")
     
+    @pytest.mark.slow
     def test_comprehensive_dashboard_creation(self):
         """Test comprehensive dashboard creation"""
         chart_path = self.visualizer.create_comprehensive_dashboard(
@@ -210,6 +375,19 @@ class TestWeatherVisualizer:
         
         logger.info("✅ Comprehensive dashboard creation test passed")
     
+    @pytest.mark.slow
+    def test_charts_tolerate_missing_readings(self):
+        """Test that a NaN reading (kept rows with a missing wind/humidity value) still renders"""
+        df = self.sample_df.astype({'humidity': float}).assign(
+            humidity=[70.0, np.nan, 80.0], wind_speed_mph=[11.2, np.nan, 8.9]
+        )
+        
+        assert os.path.exists(self.visualizer.create_humidity_wind_analysis(df))
+        assert os.path.exists(self.visualizer.create_comprehensive_dashboard(df, self.sample_insights))
+        
+        logger.info("✅ Missing reading chart test passed")
+    
+    @pytest.mark.slow
     def test_all_visualizations_generation(self):
         """Test generating all visualizations at once"""
         chart_paths = self.visualizer.generate_all_visualizations(
@@ -224,6 +402,53 @@ class TestWeatherVisualizer:
             assert path.endswith('.png')
         
         logger.info(f"✅ All visualizations generation test passed ({len(chart_paths)} charts)")
+    
+    @pytest.mark.slow
+    def test_unchanged_data_reuses_charts(self):
+        """Test that regenerating with identical inputs skips re-rendering"""
+        first = self.visualizer.generate_all_visualizations(self.sample_df, self.sample_insights)
+        mtimes = {name: os.stat(path).st_mtime_ns for name, path in first.items()}
+        
+        second = self.visualizer.generate_all_visualizations(self.sample_df, self.sample_insights)
+        
+        assert second == first
+        assert {name: os.stat(path).st_mtime_ns for name, path in second.items()} == mtimes
+        
+        logger.info("✅ Unchanged chart reuse test passed")
+    
+    def test_dashboard_key_ignores_sub_minute_time(self):
+        """Test that fresh insights timestamps within the drawn minute keep the dashboard cached"""
+        earlier = {**self.sample_insights, 'data_collection_time': '2024-01-01T12:30:05.123456'}
+        later = {**self.sample_insights, 'data_collection_time': '2024-01-01T12:30:41.654321'}
+        next_minute = {**self.sample_insights, 'data_collection_time': '2024-01-01T12:31:00.000001'}
+        
+        key = self.visualizer._chart_cache_keys(self.sample_df, earlier)['comprehensive_dashboard']
+        
+        assert self.visualizer._chart_cache_keys(self.sample_df, later)['comprehensive_dashboard'] == key
+        assert self.visualizer._chart_cache_keys(self.sample_df, next_minute)['comprehensive_dashboard'] != key
+        
+        logger.info("✅ Dashboard cache key test passed")
+    
+    @pytest.mark.slow
+    def test_broken_chart_pool_recovers(self, monkeypatch):
+        """Test that a killed chart worker does not break later refreshes"""
+        monkeypatch.setattr(visualizations, 'config', dataclasses.replace(config, CHART_PROCESSES=2))
+        try:
+            self.visualizer.generate_all_visualizations(self.sample_df.assign(humidity=[71, 61, 81]),
+                                                        self.sample_insights)
+            for process in list(self.visualizer._pool._processes.values()):
+                os.kill(process.pid, signal.SIGKILL)
+            
+            chart_paths = self.visualizer.generate_all_visualizations(
+                self.sample_df.assign(humidity=[72, 62, 82]), self.sample_insights
+            )
+            
+            assert set(chart_paths) == set(WeatherVisualizer.CHART_FILES)
+            assert self.visualizer._pool is None
+        finally:
+            self.visualizer.close()
+        
+        logger.info("✅ Broken chart pool recovery test passed")
 
 class TestConfiguration:
     """Test configuration management"""
@@ -238,9 +463,14 @@ class TestConfiguration:
         # Test cities list
         assert len(config.CITIES) == 10
         for city in config.CITIES:
-            assert 'City' in city
-            assert 'Latitude' in city
-            assert 'Longitude' in city
+            assert isinstance(city.name, str)
+            assert -90 <= city.lat <= 90
+            assert -180 <= city.lon <= 180
+            assert city['City'] == city.name
+        
+        # Test parallel city arrays
+        assert len(config.CITY_NAMES) == len(config.LATS) == len(config.LONS) == 10
+        assert config.LATS.dtype == np.float64
         
         logger.info("✅ Configuration test passed")
     
@@ -253,7 +483,7 @@ class TestConfiguration:
         
         logger.info("✅ Directory creation test passed")
 
-def test_csv_export():
+def test_csv_export(scraper):
     """Test CSV export functionality"""
     # Create sample data
     sample_df = pd.DataFrame({
@@ -269,19 +499,125 @@ def test_csv_export():
     })
     
     # Export to CSV
-    csv_path = config.OUTPUT_CSV_FILE
-    sample_df.to_csv(csv_path, index=False)
+    csv_path = scraper.export_to_csv(sample_df)
+    assert csv_path == config.OUTPUT_CSV_FILE
     
     # Verify file exists and has content
     assert os.path.exists(csv_path)
     
     # Read back and verify
-    read_df = pd.read_csv(csv_path)
+    read_df = pacsv.read_csv(csv_path).to_pandas()
     assert len(read_df) == 1
     assert read_df['city'].iloc[0] == 'Test City'
     
     logger.info("✅ CSV export test passed")
 
+def test_table_rows_generation():
+    """Test dashboard table row rendering"""
+    sample_df = pd.DataFrame({
+        'city': ['Test City', 'Other City'],
+        'temperature_c': [20.04, -3.0],
+        'temperature_f': [68.07, 26.6],
+        'humidity': [65, 80],
+        'wind_speed_ms': [5.0, 1.25],
+        'wind_speed_mph': [11.2, 2.8]
+    })
+    
+    rows = app._generate_table_rows(sample_df)
+    
+    assert rows.count("<tr>") == 2
+    assert "<td><strong>Test City</strong></td><td>20.0°C</td><td>68.1°F</td>" in rows
+    assert "<td>80%</td><td>1.2 m/s</td><td>2.8 mph</td>" in rows
+    assert app._generate_table_rows(pd.DataFrame()) == "<tr><td colspan='6'>No data available</td></tr>"
+    
+    logger.info("✅ Table rows generation test passed")
+
+def test_cached_frame_humidity_type_is_stable():
+    """Test that /api/data humidity has one type whether or not readings are whole"""
+    whole = app._to_cached_frame(SAMPLE_DF)
+    fractional = app._to_cached_frame(SAMPLE_DF.assign(humidity=[70.5, 60.0, np.nan]))
+    
+    assert whole['humidity'].dtype == fractional['humidity'].dtype
+    assert all(isinstance(record['humidity'], float) for record in whole.to_dict('records'))
+    
+    logger.info("✅ Cached frame dtype test passed")
+
+def test_accept_encoding_parsing():
+    """Test gzip negotiation against Accept-Encoding q-values"""
+    assert app._accepts_gzip("gzip")
+    assert app._accepts_gzip("deflate, gzip;q=0.5")
+    assert app._accepts_gzip("*")
+    assert not app._accepts_gzip("")
+    assert not app._accepts_gzip("gzip;q=0")
+    assert not app._accepts_gzip("br, gzip; q=0.0, *;q=1")
+    assert not app._accepts_gzip("identity")
+    
+    logger.info("✅ Accept-Encoding parsing test passed")
+
+@pytest.fixture
+def web_client(monkeypatch, tmp_path):
+    """TestClient over the app with sample data cached and a temporary CSV export"""
+    from fastapi.testclient import TestClient
+    
+    # Register every cache global with monkeypatch so _update_cache's writes are undone
+    for name in ("cached_weather_data", "cached_insights", "cached_charts", "last_update_time",
+                 "last_update_iso", "cached_chart_version", "cached_csv_filename",
+                 "cached_homepage_html", "cached_api_data_table_html", "cached_api_data_json"):
+        monkeypatch.setattr(app, name, getattr(app, name))
+    app._update_cache(SAMPLE_DF, SAMPLE_INSIGHTS, {}, datetime.now())
+    
+    csv_path = tmp_path / "weather_data.csv"
+    monkeypatch.setattr(app, "config", dataclasses.replace(config, OUTPUT_CSV_FILE=str(csv_path)))
+    
+    # No context manager: the startup scrape is not needed here
+    return TestClient(app.app)
+
+def test_csv_download_content_negotiation(web_client):
+    """Test that the gzip and identity CSV downloads carry the same bytes"""
+    csv_path = app.config.OUTPUT_CSV_FILE
+    csv_bytes = SAMPLE_DF.to_csv(index=False).encode() * 20
+    with open(csv_path, "wb") as f:
+        f.write(csv_bytes)
+    with open(csv_path + ".gz", "wb") as f:
+        f.write(gzip.compress(csv_bytes))
+    
+    compressed = web_client.get("/download/csv", headers={"Accept-Encoding": "gzip"})
+    refused = web_client.get("/download/csv", headers={"Accept-Encoding": "gzip;q=0"})
+    identity = web_client.get("/download/csv", headers={"Accept-Encoding": "identity"})
+    
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in refused.headers
+    assert "content-encoding" not in identity.headers
+    # The client transparently decodes gzip, so all three bodies must match the file
+    assert compressed.content == refused.content == identity.content == csv_bytes
+    
+    logger.info("✅ CSV download negotiation test passed")
+
+def test_gzip_middleware_skips_charts(web_client):
+    """Test that HTML/JSON are gzipped while chart PNGs are served as-is"""
+    chart_path = os.path.join(config.CHARTS_DIR, "_gzip_check.png")
+    with open(chart_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n" + bytes(4096))
+    try:
+        png = web_client.get("/static/charts/_gzip_check.png", headers={"Accept-Encoding": "gzip"})
+    finally:
+        os.remove(chart_path)
+    html = web_client.get("/", headers={"Accept-Encoding": "gzip"})
+    api_json = web_client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+    html_refused = web_client.get("/", headers={"Accept-Encoding": "gzip;q=0"})
+    
+    assert png.status_code == 200
+    assert "content-encoding" not in png.headers
+    assert html.headers["content-type"].startswith("text/html")
+    assert html.headers["content-encoding"] == "gzip"
+    assert api_json.headers["content-type"] == "application/json"
+    assert api_json.headers["content-encoding"] == "gzip"
+    assert "content-encoding" not in html_refused.headers
+    assert html_refused.content == html.content
+    
+    logger.info("✅ Gzip middleware skip list test passed")
+
+@pytest.mark.asyncio
 async def test_web_application():
     """Test web application endpoints (basic smoke test)"""
     try:
@@ -296,7 +632,7 @@ async def test_web_application():
     except Exception as e:
         logger.error(f"❌ Web application test failed: {e}")
 
-def run_integration_test():
+async def run_integration_test():
     """Run a full integration test"""
     logger.info("🧪 Starting integration test...")
     
@@ -307,7 +643,7 @@ def run_integration_test():
         
         # 1. Collect data
         logger.info("1. Testing data collection...")
-        weather_df = scraper.scrape_all_cities()
+        weather_df = await scraper.scrape_all_cities()
         
         if weather_df.empty:
             logger.warning("⚠️ No weather data collected - possibly network issues")
@@ -317,14 +653,14 @@ def run_integration_test():
         logger.info("2. Testing insights generation...")
         insights = scraper.get_weather_insights(weather_df)
         
-        # 3. Create visualizations
+        # 3./4. Create visualizations and export CSV concurrently (independent of each other)
         logger.info("3. Testing visualizations...")
-        charts = visualizer.generate_all_visualizations(weather_df, insights)
-        
-        # 4. Export CSV
         logger.info("4. Testing CSV export...")
-        csv_path = config.OUTPUT_CSV_FILE
-        weather_df.to_csv(csv_path, index=False)
+        charts, csv_path = await asyncio.gather(
+            asyncio.to_thread(visualizer.generate_all_visualizations, weather_df, insights),
+            asyncio.to_thread(scraper.export_to_csv, weather_df)
+        )
+        visualizer.close()
         
         # Verify everything worked
         assert len(insights) > 0
@@ -342,58 +678,12 @@ def run_integration_test():
         logger.error(f"❌ Integration test failed: {e}")
         return False
 
-def main():
-    """Run all tests"""
-    print("🧪 Singular Weather Analytics - Test Suite")
-    print("=" * 50)
-    
-    # Run individual component tests
-    logger.info("Running component tests...")
-    
-    # Weather scraper tests
-    test_scraper = TestWeatherScraper()
-    test_scraper.setup_method()
-    test_scraper.test_weather_scraper_initialization()
-    test_scraper.test_single_city_data_fetch()
-    test_scraper.test_all_cities_data_collection()
-    test_scraper.test_data_processing()
-    test_scraper.test_insights_generation()
-    
-    # Visualizer tests
-    test_viz = TestWeatherVisualizer()
-    test_viz.setup_method()
-    test_viz.test_visualizer_initialization()
-    test_viz.test_temperature_chart_creation()
-    test_viz.test_humidity_wind_chart_creation()
-    test_viz.test_comprehensive_dashboard_creation()
-    test_viz.test_all_visualizations_generation()
-    
-    # Configuration tests
-    test_config = TestConfiguration()
-    test_config.test_config_values()
-    test_config.test_directory_creation()
-    
-    # Other tests
-    test_csv_export()
-    
-    # Web application test
-    asyncio.run(test_web_application())
+if __name__ == "__main__":
+    # Component tests run in parallel; loadfile keeps this module's chart tests on one worker
+    exit_code = pytest.main([__file__, "-n", "auto", "--dist", "loadfile"])
     
     # Integration test
     logger.info("\nRunning integration test...")
-    integration_success = run_integration_test()
-    
-    print("\n" + "=" * 50)
-    if integration_success:
-        print("🎉 ALL TESTS PASSED! Application is ready for production.")
-        print("\nTo start the application:")
-        print("  python app.py")
-        print("\nThen visit: http://localhost:8000")
-    else:
-        print("❌ Some tests failed. Check the logs above.")
-    
-    return integration_success
-
-if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1) 
\ No newline at end of file
+    integration_success = asyncio.run(run_integration_test())
+    
+    sys.exit(0 if exit_code == 0 and integration_success else 1) 
\ No newline at end of file
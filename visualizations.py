@@ -3,12 +3,26 @@ Weather Data Visualization Module
 Professional data visualization for Singular Analytics Platform
 """
 
+import matplotlib
+# Headless rendering only: pin Agg before pyplot so no GUI backend is probed
+matplotlib.use('Agg', force=True)
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import ScaledTranslation
 import seaborn as sns
+from PIL import Image
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Optional
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+import time
+import multiprocessing
 import os
+import hashlib
+import json
 from datetime import datetime
 import logging
 from config import config
@@ -20,16 +34,129 @@ logger = logging.getLogger(__name__)
 plt.style.use('default')
 sns.set_palette("husl")
 
+# Let Agg merge sub-pixel path segments instead of rasterizing each one
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+
+@lru_cache(maxsize=32)
+def _palette(name: str, n: int) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Seaborn palette, built once per (name, size)
+    
+    Args:
+        name: Seaborn/matplotlib palette name
+        n: Number of colors
+    
+    Returns:
+        Tuple of RGB colors
+    """
+    return tuple(sns.color_palette(name, n))
+
+@lru_cache(maxsize=32)
+def _colormap_colors(name: str, n: int, low: float, high: float) -> Tuple[Tuple[float, ...], ...]:
+    """
+    Evenly spaced RGBA samples of a matplotlib colormap, built once per arguments
+    
+    Args:
+        name: Colormap name
+        n: Number of colors
+        low: Start of the sampled range (0-1)
+        high: End of the sampled range (0-1)
+    
+    Returns:
+        Tuple of RGBA colors
+    """
+    return tuple(map(tuple, plt.get_cmap(name)(np.linspace(low, high, n))))
+
+def _label_bars(ax, bars, fmt: str, pad: float):
+    """
+    Write each bar's height just above it in bold
+    
+    Args:
+        ax: Axes holding the bars
+        bars: BarContainer returned by ax.bar
+        fmt: Format string applied to the height
+        pad: Gap above the bar, in data units
+    """
+    text_kwargs = dict(ha='center', va='bottom', fontweight='bold')
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + pad, fmt.format(height), **text_kwargs)
+
+def _label_points(fig, ax, labels, x, y, fontsize: float, **kwargs):
+    """
+    Label scatter points, offset 5pt up and right like annotate's offset points
+    
+    Args:
+        fig: Figure holding the axes
+        ax: Target axes
+        labels: Text for each point
+        x: Point x data coordinates
+        y: Point y data coordinates
+        fontsize: Label font size in points
+        **kwargs: Extra Text options (e.g. bbox)
+    """
+    # One offset transform and option dict for every label instead of per-annotation setup
+    text_kwargs = dict(kwargs, fontsize=fontsize,
+                       transform=ax.transData + ScaledTranslation(5/72, 5/72, fig.dpi_scale_trans))
+    for label, xi, yi in zip(labels, x, y):
+        ax.text(xi, yi, label, **text_kwargs)
+
+# Per-process visualizer used by chart pool workers
+_worker_visualizer = None
+
+def _init_chart_worker():
+    """Pool initializer: build the worker's visualizer (Agg, fonts, rcParams) up front"""
+    global _worker_visualizer
+    matplotlib.use('Agg', force=True)
+    _worker_visualizer = WeatherVisualizer()
+
+def _render_chart(method_name: str, *args) -> str:
+    """
+    Render one chart inside a pool worker process
+    
+    Args:
+        method_name: WeatherVisualizer method that draws and saves the chart
+        *args: Arguments for that method (DataFrame, insights)
+    
+    Returns:
+        Path to the saved chart image
+    """
+    global _worker_visualizer
+    if _worker_visualizer is None:
+        _worker_visualizer = WeatherVisualizer()
+    return getattr(_worker_visualizer, method_name)(*args)
+
 class WeatherVisualizer:
     """
     Professional weather data visualization suite
     Designed for analytics and business intelligence dashboards
     """
     
+    # Chart names mapped to the files they are saved as inside charts_dir
+    CHART_FILES = {
+        'temperature_comparison': 'temperature_comparison.png',
+        'humidity_wind_analysis': 'humidity_wind_analysis.png',
+        'comprehensive_dashboard': 'weather_dashboard.png'
+    }
+    
+    # Per-chart content hashes of the inputs behind the PNGs on disk
+    CACHE_KEY_FILE = '.cache_key'
+    
     def __init__(self):
         self.charts_dir = config.CHARTS_DIR
         self.figure_size = (12, 8)
-        self.dpi = 300
+        # Screen resolution; 300 DPI quadruples raster and PNG encode work
+        self.dpi = config.CHART_DPI
+        # Fast zlib setting: much less encode CPU for slightly larger files
+        self.png_kwargs = {'optimize': False, 'compress_level': 1}
+        
+        # Chart worker processes, started on first use and reused across refreshes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # Long-lived figures, one per chart, cleared and redrawn on each render
+        self._figures: Dict[str, Figure] = {}
         
         # Ensure charts directory exists
         os.makedirs(self.charts_dir, exist_ok=True)
@@ -57,43 +184,36 @@ class WeatherVisualizer:
         Returns:
             Path to the saved chart image
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        fig = self._get_figure('temperature_comparison', figsize=(16, 8), layout='constrained')
+        ax1, ax2 = fig.subplots(1, 2)
         
         # Celsius chart
         bars1 = ax1.bar(df['city'], df['temperature_c'], 
-                       color=sns.color_palette("coolwarm", len(df)))
+                       color=list(_palette("coolwarm", len(df))))
         ax1.set_title('Temperature Comparison (Celsius)', fontweight='bold', pad=20)
         ax1.set_xlabel('Cities')
         ax1.set_ylabel('Temperature (°C)')
         ax1.tick_params(axis='x', rotation=45)
         
         # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}°C', ha='center', va='bottom', fontweight='bold')
+        _label_bars(ax1, bars1, '{:.1f}°C', 0.5)
         
         # Fahrenheit chart
         bars2 = ax2.bar(df['city'], df['temperature_f'], 
-                       color=sns.color_palette("coolwarm", len(df)))
+                       color=list(_palette("coolwarm", len(df))))
         ax2.set_title('Temperature Comparison (Fahrenheit)', fontweight='bold', pad=20)
         ax2.set_xlabel('Cities')
         ax2.set_ylabel('Temperature (°F)')
         ax2.tick_params(axis='x', rotation=45)
         
         # Add value labels on bars
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{height:.1f}°F', ha='center', va='bottom', fontweight='bold')
+        _label_bars(ax2, bars2, '{:.1f}°F', 1)
         
-        plt.suptitle('Global Weather Temperature Analysis', fontsize=16, fontweight='bold')
-        plt.tight_layout()
+        fig.suptitle('Global Weather Temperature Analysis', fontsize=16, fontweight='bold')
         
         # Save chart
-        chart_path = os.path.join(self.charts_dir, 'temperature_comparison.png')
-        plt.savefig(chart_path, bbox_inches='tight', dpi=self.dpi)
-        plt.close()
+        chart_path = os.path.join(self.charts_dir, self.CHART_FILES['temperature_comparison'])
+        self._save_fast(fig, chart_path)
         
         logger.info(f"Temperature comparison chart saved to {chart_path}")
         return chart_path
@@ -108,33 +228,28 @@ class WeatherVisualizer:
         Returns:
             Path to the saved chart image
         """
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig = self._get_figure('humidity_wind_analysis', figsize=(16, 12), layout='constrained')
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Humidity bar chart
         bars1 = ax1.bar(df['city'], df['humidity'], 
-                       color=sns.color_palette("Blues_r", len(df)))
+                       color=list(_palette("Blues_r", len(df))))
         ax1.set_title('Humidity Levels by City', fontweight='bold')
         ax1.set_xlabel('Cities')
         ax1.set_ylabel('Humidity (%)')
         ax1.tick_params(axis='x', rotation=45)
         
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 1,
-                    f'{height:.0f}%', ha='center', va='bottom', fontweight='bold')
+        _label_bars(ax1, bars1, '{:.0f}%', 1)
         
         # Wind speed bar chart (mph)
         bars2 = ax2.bar(df['city'], df['wind_speed_mph'], 
-                       color=sns.color_palette("Greens", len(df)))
+                       color=list(_palette("Greens", len(df))))
         ax2.set_title('Wind Speed by City (mph)', fontweight='bold')
         ax2.set_xlabel('Cities')
         ax2.set_ylabel('Wind Speed (mph)')
         ax2.tick_params(axis='x', rotation=45)
         
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.2,
-                    f'{height:.1f}', ha='center', va='bottom', fontweight='bold')
+        _label_bars(ax2, bars2, '{:.1f}', 0.2)
         
         # Humidity vs Temperature scatter plot
         scatter = ax3.scatter(df['temperature_c'], df['humidity'], 
@@ -144,12 +259,11 @@ class WeatherVisualizer:
         ax3.set_ylabel('Humidity (%)')
         
         # Add city labels to scatter plot
-        for i, city in enumerate(df['city']):
-            ax3.annotate(city, (df['temperature_c'].iloc[i], df['humidity'].iloc[i]),
-                        xytext=(5, 5), textcoords='offset points', fontsize=8)
+        _label_points(fig, ax3, df['city'].to_numpy(), df['temperature_c'].to_numpy(),
+                      df['humidity'].to_numpy(), 8)
         
         # Add colorbar for wind speed
-        cbar = plt.colorbar(scatter, ax=ax3)
+        cbar = fig.colorbar(scatter, ax=ax3)
         cbar.set_label('Wind Speed (mph)')
         
         # Wind speed distribution
@@ -161,14 +275,12 @@ class WeatherVisualizer:
                    label=f'Average: {df["wind_speed_mph"].mean():.1f} mph')
         ax4.legend()
         
-        plt.suptitle('Weather Analytics Dashboard - Humidity & Wind Analysis', 
+        fig.suptitle('Weather Analytics Dashboard - Humidity & Wind Analysis', 
                      fontsize=16, fontweight='bold')
-        plt.tight_layout()
         
         # Save chart
-        chart_path = os.path.join(self.charts_dir, 'humidity_wind_analysis.png')
-        plt.savefig(chart_path, bbox_inches='tight', dpi=self.dpi)
-        plt.close()
+        chart_path = os.path.join(self.charts_dir, self.CHART_FILES['humidity_wind_analysis'])
+        self._save_fast(fig, chart_path)
         
         logger.info(f"Humidity and wind analysis chart saved to {chart_path}")
         return chart_path
@@ -184,7 +296,7 @@ class WeatherVisualizer:
         Returns:
             Path to the saved dashboard image
         """
-        fig = plt.figure(figsize=(24, 16))
+        fig = self._get_figure('comprehensive_dashboard', figsize=(24, 16), facecolor='white')
         
         # Create a grid layout with better spacing
         gs = fig.add_gridspec(3, 4, hspace=0.45, wspace=0.35, 
@@ -193,28 +305,26 @@ class WeatherVisualizer:
         # Main temperature chart
         ax1 = fig.add_subplot(gs[0, :2])
         bars = ax1.bar(df['city'], df['temperature_c'], 
-                      color=plt.cm.RdYlBu_r(np.linspace(0.2, 0.8, len(df))))
+                      color=list(_colormap_colors('RdYlBu_r', len(df), 0.2, 0.8)))
         ax1.set_title('Global Temperature Overview (°C)', fontweight='bold', fontsize=14)
         ax1.tick_params(axis='x', rotation=45)
         ax1.set_ylabel('Temperature (°C)')
         
         # Add temperature values on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}°', ha='center', va='bottom', fontweight='bold')
+        _label_bars(ax1, bars, '{:.1f}°', 0.5)
         
         # Humidity pie chart (top cities)
         ax2 = fig.add_subplot(gs[0, 2])
-        top_humid = df.nlargest(5, 'humidity')
+        # nlargest keeps NaN when n covers every row, and a NaN wedge breaks pie()
+        top_humid = df.dropna(subset=['humidity']).nlargest(5, 'humidity')
         ax2.pie(top_humid['humidity'], labels=top_humid['city'], autopct='%1.1f%%',
-               startangle=90, colors=sns.color_palette("Blues", 5))
+               startangle=90, colors=list(_palette("Blues", 5)))
         ax2.set_title('Top 5 Most Humid Cities', fontweight='bold')
         
         # Wind speed radar chart simulation
         ax3 = fig.add_subplot(gs[0, 3])
         ax3.bar(range(len(df)), df['wind_speed_mph'], 
-               color=sns.color_palette("Greens", len(df)))
+               color=list(_palette("Greens", len(df))))
         ax3.set_title('Wind Speed (mph)', fontweight='bold')
         ax3.set_xticks(range(len(df)))
         ax3.set_xticklabels([city[:3] for city in df['city']], rotation=45)
@@ -229,10 +339,9 @@ class WeatherVisualizer:
         ax4.set_title('Temperature vs Humidity (bubble size = wind speed)', fontweight='bold')
         
         # Add city labels with better positioning
-        for i, city in enumerate(df['city']):
-            ax4.annotate(city, (df['temperature_c'].iloc[i], df['humidity'].iloc[i]),
-                        xytext=(5, 5), textcoords='offset points', fontsize=9, 
-                        bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.7))
+        _label_points(fig, ax4, df['city'].to_numpy(), df['temperature_c'].to_numpy(),
+                      df['humidity'].to_numpy(), 9,
+                      bbox=dict(boxstyle="round,pad=0.2", facecolor="white", alpha=0.7))
         
         # Key insights text box
         ax5 = fig.add_subplot(gs[1, 2:])
@@ -315,14 +424,30 @@ class WeatherVisualizer:
         fig.suptitle('🌤️ Singular Weather Analytics Dashboard - Global Weather Intelligence', 
                      fontsize=20, fontweight='bold', y=0.97)
         
-        # Save dashboard with optimized settings
-        dashboard_path = os.path.join(self.charts_dir, 'weather_dashboard.png')
-        plt.savefig(dashboard_path, bbox_inches='tight', dpi=150, facecolor='white')
-        plt.close()
+        # Save dashboard with optimized settings; the GridSpec margins already
+        # frame the figure, so no tight bbox pass is needed
+        dashboard_path = os.path.join(self.charts_dir, self.CHART_FILES['comprehensive_dashboard'])
+        self._save_fast(fig, dashboard_path)
         
         logger.info(f"Comprehensive weather dashboard saved to {dashboard_path}")
         return dashboard_path
     
+    def get_existing_charts(self) -> Dict[str, str]:
+        """
+        Find charts already rendered into the charts directory
+        
+        Returns:
+            Dictionary mapping chart names to file paths that exist on disk
+        """
+        chart_paths = {}
+        
+        for chart_name, filename in self.CHART_FILES.items():
+            chart_path = os.path.join(self.charts_dir, filename)
+            if os.path.exists(chart_path):
+                chart_paths[chart_name] = chart_path
+        
+        return chart_paths
+    
     def generate_all_visualizations(self, df: pd.DataFrame, insights: Dict) -> Dict[str, str]:
         """
         Generate all weather visualizations
@@ -337,19 +462,216 @@ class WeatherVisualizer:
         logger.info("Generating comprehensive weather visualizations")
         
         chart_paths = {}
+        jobs = {
+            'temperature_comparison': ('create_temperature_comparison_chart', df),
+            'humidity_wind_analysis': ('create_humidity_wind_analysis', df),
+            'comprehensive_dashboard': ('create_comprehensive_dashboard', df, insights)
+        }
+        
+        # Reuse charts whose inputs are unchanged since they were last written
+        cache_keys = self._chart_cache_keys(df, insights)
+        stored_keys = self._read_cache_keys()
+        for chart_name in list(jobs):
+            chart_path = os.path.join(self.charts_dir, self.CHART_FILES[chart_name])
+            # The PNG's mtime is recorded too, so a file rewritten by a direct
+            # create_* call is never mistaken for the cached render
+            if stored_keys.get(chart_name) == [cache_keys[chart_name], self._chart_mtime(chart_path)]:
+                chart_paths[chart_name] = chart_path
+                del jobs[chart_name]
+        
+        if not jobs:
+            logger.info("Weather data unchanged, reusing existing visualizations")
+            return chart_paths
         
         try:
-            # Generate all charts
-            chart_paths['temperature_comparison'] = self.create_temperature_comparison_chart(df)
-            chart_paths['humidity_wind_analysis'] = self.create_humidity_wind_analysis(df)
-            chart_paths['comprehensive_dashboard'] = self.create_comprehensive_dashboard(df, insights)
+            if config.CHART_PROCESSES > 1:
+                # The charts are independent, so rasterize and encode them in parallel
+                try:
+                    pool = self._get_pool()
+                    futures = {
+                        chart_name: pool.submit(_render_chart, *job)
+                        for chart_name, job in jobs.items()
+                    }
+                    deadline = time.monotonic() + config.CHART_TIMEOUT_SECONDS
+                    for chart_name, future in futures.items():
+                        chart_paths[chart_name] = future.result(
+                            timeout=max(deadline - time.monotonic(), 0)
+                        )
+                except (BrokenProcessPool, FuturesTimeoutError) as e:
+                    # A dead or hung worker poisons the pool; drop it so the next
+                    # refresh starts a fresh one, and finish this one in-process
+                    logger.warning(f"Chart workers failed ({e!r}), rendering in-process")
+                    self._discard_pool()
             
-            logger.info(f"Successfully generated {len(chart_paths)} visualizations")
+            # Single-process path, also picks up whatever the pool did not finish
+            for chart_name, (method_name, *args) in jobs.items():
+                if chart_name not in chart_paths:
+                    chart_paths[chart_name] = getattr(self, method_name)(*args)
+            
+            logger.info(f"Successfully generated {len(jobs)} visualizations "
+                        f"({len(chart_paths) - len(jobs)} unchanged)")
             
         except Exception as e:
             logger.error(f"Error generating visualizations: {e}")
+        
+        # Only charts that were actually written (or kept) get their key recorded
+        self._write_cache_keys({
+            name: [cache_keys[name], self._chart_mtime(path)] for name, path in chart_paths.items()
+        })
             
         return chart_paths
+    
+    def _chart_cache_keys(self, df: pd.DataFrame, insights: Dict) -> Dict[str, str]:
+        """
+        Content hashes of each chart's inputs
+        
+        Args:
+            df: Weather DataFrame
+            insights: Weather insights dictionary
+            
+        Returns:
+            Dictionary mapping chart names to hex digests
+        """
+        data_hash = hashlib.blake2b(
+            pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+            + repr(list(df.columns)).encode()
+            + f"dpi={self.dpi}".encode(),
+            digest_size=16
+        )
+        data_key = data_hash.hexdigest()
+        
+        # Only the dashboard draws the insights, and only the collection time to
+        # the minute; the full timestamp is fresh on every call and would never match
+        drawn_insights = dict(insights)
+        if 'data_collection_time' in drawn_insights:
+            drawn_insights['data_collection_time'] = str(drawn_insights['data_collection_time'])[:16]
+        dashboard_hash = data_hash.copy()
+        dashboard_hash.update(repr(drawn_insights).encode())
+        
+        return {
+            'temperature_comparison': data_key,
+            'humidity_wind_analysis': data_key,
+            'comprehensive_dashboard': dashboard_hash.hexdigest()
+        }
+    
+    @staticmethod
+    def _chart_mtime(chart_path: str) -> Optional[int]:
+        """
+        Modification time of a chart file in nanoseconds
+        
+        Args:
+            chart_path: Path to the chart image
+            
+        Returns:
+            st_mtime_ns, or None if the file is missing
+        """
+        try:
+            return os.stat(chart_path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _read_cache_keys(self) -> Dict[str, list]:
+        """
+        Load the chart cache keys recorded by the previous render
+        
+        Returns:
+            Dictionary mapping chart names to [hex digest, PNG mtime], empty if unavailable
+        """
+        try:
+            with open(os.path.join(self.charts_dir, self.CACHE_KEY_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_cache_keys(self, cache_keys: Dict[str, list]):
+        """
+        Record the chart cache keys for the next render
+        
+        Args:
+            cache_keys: Dictionary mapping chart names to [hex digest, PNG mtime]
+        """
+        try:
+            with open(os.path.join(self.charts_dir, self.CACHE_KEY_FILE), "w") as f:
+                json.dump(cache_keys, f)
+        except OSError as e:
+            logger.warning(f"Could not write chart cache key: {e}")
+    
+    def _get_figure(self, chart_name: str, **kwargs) -> Figure:
+        """
+        Return the cached figure for a chart, cleared for redrawing
+        
+        Args:
+            chart_name: Key from CHART_FILES
+            **kwargs: Figure options used the first time it is created
+            
+        Returns:
+            Empty matplotlib Figure attached to an Agg canvas
+        """
+        fig = self._figures.get(chart_name)
+        if fig is None:
+            # Built outside pyplot so nothing registers it with the global figure manager;
+            # the output DPI is fixed here because _save_fast writes the canvas as-is
+            fig = Figure(dpi=self.dpi, **kwargs)
+            FigureCanvasAgg(fig)
+            self._figures[chart_name] = fig
+        else:
+            fig.clear()
+        return fig
+    
+    def _save_fast(self, fig: Figure, path: str):
+        """
+        Write a figure's Agg raster straight to PNG with Pillow
+        
+        Args:
+            fig: Figure to render
+            path: Output PNG path
+        """
+        fig.canvas.draw()
+        buf = fig.canvas.buffer_rgba()
+        height, width = buf.shape[:2]
+        Image.frombuffer('RGBA', (width, height), buf, 'raw', 'RGBA', 0, 1).save(
+            path, format='PNG', dpi=(self.dpi, self.dpi), **self.png_kwargs
+        )
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Return the chart worker pool, creating it on first use
+        
+        Returns:
+            Process pool sized by config.CHART_PROCESSES
+        """
+        if self._pool is None:
+            # The pool is created from a worker thread of a multi-threaded server, where
+            # fork can copy locks held by other threads into the child. forkserver forks
+            # from a clean single-threaded process that has this module preloaded
+            methods = multiprocessing.get_all_start_methods()
+            if 'forkserver' in methods:
+                context = multiprocessing.get_context('forkserver')
+                context.set_forkserver_preload([__name__])
+            else:
+                context = multiprocessing.get_context('spawn')
+            self._pool = ProcessPoolExecutor(max_workers=config.CHART_PROCESSES, mp_context=context,
+                                             initializer=_init_chart_worker)
+        return self._pool
+    
+    def _discard_pool(self):
+        """Tear down a broken or hung worker pool without waiting on it"""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        # Hung workers never exit on their own, so stop them before letting go
+        for process in list((getattr(pool, '_processes', None) or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def close(self):
+        """Shut down the chart worker pool and release cached figures"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        for fig in self._figures.values():
+            fig.clear()
+        self._figures.clear()
 
 def main():
     """
@@ -393,6 +715,8 @@ def main():
     visualizer = WeatherVisualizer()
     charts = visualizer.generate_all_visualizations(df, sample_insights)
     
+    visualizer.close()
+    
     print(f"✅ Generated {len(charts)} test visualizations:")
     for name, path in charts.items():
         print(f"  • {name}: {path}")
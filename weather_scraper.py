@@ -3,30 +3,188 @@ Weather Data Scraper Module
 Professional weather data collection and processing for Singular Analytics
 """
 
+import asyncio
+import hashlib
+import threading
+import time
+from collections import deque
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import time
-from typing import List, Dict, Optional
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from typing import Dict, List, Optional, Sequence
 import logging
 from datetime import datetime
-from config import config
+from config import config, City
+
+# Faster JSON decoding when orjson is available
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class _RateLimiter:
+    """
+    Sliding-window limiter: at most `calls` requests start in any `period` seconds
+    
+    Bursts up to the limit go out immediately; only the requests beyond it wait,
+    and only for as long as it takes the oldest slot to expire.
+    """
+    
+    def __init__(self, calls: int, period: float = 1.0):
+        self.calls = calls
+        self.period = period
+        self._starts = deque(maxlen=max(calls, 1))
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Book the next request slot
+        
+        Returns:
+            Seconds the caller has to wait before sending the request
+        """
+        if self.calls <= 0:
+            return 0.0
+        
+        # Booking under a thread lock without sleeping lets the sync and
+        # async paths share one limiter
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if self._starts:
+                start = max(start, self._starts[-1])
+                if len(self._starts) == self.calls:
+                    start = max(start, self._starts[0] + self.period)
+            self._starts.append(start)
+        return start - now
+    
+    def wait(self):
+        """Block until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def wait_async(self):
+        """Suspend until a request may be sent"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 class WeatherScraper:
     """
     Professional weather data scraper using Open-Meteo API
     Designed for analytics and business intelligence applications
     """
     
+    # Number of distinct DataFrames whose insights are remembered
+    INSIGHTS_CACHE_SIZE = 4
+    
+    # Retry policy shared by the requests adapter and the aiohttp fetch
+    FETCH_RETRIES = 3
+    RETRY_BACKOFF = 0.2
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Locations per multi-location Open-Meteo request (keeps the URL short)
+    BATCH_LOCATIONS = 50
+    
     def __init__(self):
         self.base_url = config.OPEN_METEO_BASE_URL
+        self._insights_cache: Dict[str, Dict] = {}
+        # Stays under Open-Meteo's request rate across sync and async fetches
+        self._rate_limiter = _RateLimiter(config.REQUESTS_PER_SECOND)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Singular-Weather-Analytics/1.0'
         })
+        
+        # Pooled connections sized to the fetch concurrency, with retries on
+        # transient failures instead of fixed sleeps between calls
+        adapter = HTTPAdapter(
+            pool_connections=config.MAX_CONCURRENT_REQUESTS,
+            pool_maxsize=config.MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=self.FETCH_RETRIES,
+                backoff_factor=self.RETRY_BACKOFF,
+                status_forcelist=self.RETRY_STATUSES,
+                allowed_methods=("GET",)
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def _build_params(self, latitude, longitude) -> Dict:
+        """
+        Build Open-Meteo query parameters for a location
+        
+        Args:
+            latitude: City latitude, or comma-joined latitudes for a batch
+            longitude: City longitude, or comma-joined longitudes for a batch
+            
+        Returns:
+            Dictionary of query parameters
+        """
+        # The current= block carries humidity directly, so no hourly forecast is needed
+        return {
+            'latitude': latitude,
+            'longitude': longitude,
+            'current': 'temperature_2m,relative_humidity_2m,wind_speed_10m',
+            'wind_speed_unit': 'ms'
+        }
+    
+    def _parse_weather_response(self, data: Dict, latitude: float, longitude: float, city_name: str) -> Dict:
+        """
+        Extract the fields we use from an Open-Meteo response
+        
+        Args:
+            data: Decoded JSON response
+            latitude: City latitude
+            longitude: City longitude
+            city_name: Name of the city
+            
+        Returns:
+            Dictionary with weather data
+        """
+        current = data.get('current')
+        if current is not None:
+            return {
+                'city': city_name,
+                'latitude': latitude,
+                'longitude': longitude,
+                'temperature_c': current.get('temperature_2m'),
+                'humidity': current.get('relative_humidity_2m'),
+                'wind_speed_ms': current.get('wind_speed_10m'),
+                'timestamp': current.get('time', datetime.now().isoformat())
+            }
+        
+        # Older response shape: current_weather plus an hourly series for humidity
+        current_weather = data.get('current_weather', {})
+        hourly = data.get('hourly', {})
+        
+        # Get the first hourly reading for humidity (current_weather doesn't include humidity)
+        humidity = None
+        if hourly.get('relative_humidity_2m') and len(hourly['relative_humidity_2m']) > 0:
+            humidity = hourly['relative_humidity_2m'][0]
+        
+        return {
+            'city': city_name,
+            'latitude': latitude,
+            'longitude': longitude,
+            'temperature_c': current_weather.get('temperature'),
+            'humidity': humidity,
+            'wind_speed_ms': current_weather.get('windspeed'),
+            'timestamp': current_weather.get('time', datetime.now().isoformat())
+        }
     
     def fetch_weather_data(self, latitude: float, longitude: float, city_name: str) -> Optional[Dict]:
         """
@@ -41,36 +199,14 @@ class WeatherScraper:
             Dictionary with weather data or None if failed
         """
         try:
-            params = {
-                'latitude': latitude,
-                'longitude': longitude,
-                'current_weather': 'true',
-                'hourly': 'temperature_2m,relative_humidity_2m,wind_speed_10m',
-                'forecast_days': 1
-            }
+            params = self._build_params(latitude, longitude)
             
+            self._rate_limiter.wait()
             logger.info(f"Fetching weather data for {city_name}")
             response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             
-            data = response.json()
-            current_weather = data.get('current_weather', {})
-            hourly = data.get('hourly', {})
-            
-            # Get the first hourly reading for humidity (current_weather doesn't include humidity)
-            humidity = None
-            if hourly.get('relative_humidity_2m') and len(hourly['relative_humidity_2m']) > 0:
-                humidity = hourly['relative_humidity_2m'][0]
-            
-            return {
-                'city': city_name,
-                'latitude': latitude,
-                'longitude': longitude,
-                'temperature_c': current_weather.get('temperature'),
-                'humidity': humidity,
-                'wind_speed_ms': current_weather.get('windspeed'),
-                'timestamp': current_weather.get('time', datetime.now().isoformat())
-            }
+            return self._parse_weather_response(_json_loads(response.content), latitude, longitude, city_name)
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed for {city_name}: {e}")
@@ -79,45 +215,190 @@ class WeatherScraper:
             logger.error(f"Unexpected error for {city_name}: {e}")
             return None
     
-    def scrape_all_cities(self, cities: List[Dict] = None) -> pd.DataFrame:
+    async def _get_json_async(self, http: aiohttp.ClientSession, params: Dict,
+                              label: str) -> Optional[object]:
+        """
+        GET the Open-Meteo endpoint and decode the JSON body, retrying transient failures
+        
+        Args:
+            http: Shared aiohttp client session
+            params: Query parameters
+            label: Description of the request for logging
+            
+        Returns:
+            Decoded JSON or None if failed
+        """
+        for attempt in range(self.FETCH_RETRIES + 1):
+            try:
+                await self._rate_limiter.wait_async()
+                logger.info(f"Fetching weather data for {label}")
+                async with http.get(self.base_url, params=params) as response:
+                    response.raise_for_status()
+                    return _json_loads(await response.read())
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # Same policy as the requests adapter: back off on throttling,
+                # server errors and connection failures, give up on other statuses
+                retryable = (not isinstance(e, aiohttp.ClientResponseError)
+                             or e.status in self.RETRY_STATUSES)
+                if not retryable or attempt == self.FETCH_RETRIES:
+                    logger.error(f"API request failed for {label}: {e}")
+                    return None
+                delay = self.RETRY_BACKOFF * 2 ** attempt
+                logger.warning(f"API request failed for {label} ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"Unexpected error for {label}: {e}")
+                return None
+    
+    async def _fetch_weather_data_async(self, http: aiohttp.ClientSession, latitude: float,
+                                        longitude: float, city_name: str) -> Optional[Dict]:
         """
-        Scrape weather data for all cities and return processed DataFrame
+        Fetch current weather data for a specific location without blocking the event loop
         
         Args:
-            cities: List of city dictionaries with Latitude, Longitude, City keys
+            http: Shared aiohttp client session
+            latitude: City latitude
+            longitude: City longitude
+            city_name: Name of the city for logging
+            
+        Returns:
+            Dictionary with weather data or None if failed
+        """
+        data = await self._get_json_async(http, self._build_params(latitude, longitude), city_name)
+        if data is None:
+            return None
+        try:
+            return self._parse_weather_response(data, latitude, longitude, city_name)
+        except Exception as e:
+            logger.error(f"Unexpected error for {city_name}: {e}")
+            return None
+    
+    async def _fetch_batch_async(self, http: aiohttp.ClientSession, cities: Sequence[City],
+                                 lats: np.ndarray, lons: np.ndarray) -> List[Optional[Dict]]:
+        """
+        Fetch current weather for several locations in one multi-location request
+        
+        Args:
+            http: Shared aiohttp client session
+            cities: City records in request order
+            lats: Latitudes matching cities
+            lons: Longitudes matching cities
+            
+        Returns:
+            List of weather dictionaries (None for failed cities), in city order
+        """
+        params = self._build_params(','.join(map(str, lats)), ','.join(map(str, lons)))
+        data = await self._get_json_async(http, params, f"{len(cities)} cities")
+        
+        # Open-Meteo answers a multi-location query with a list in request order,
+        # and a single location with a bare object
+        if isinstance(data, dict):
+            data = [data]
+        if isinstance(data, list) and len(data) == len(cities):
+            try:
+                return [
+                    self._parse_weather_response(location, lat, lon, name)
+                    for (name, lat, lon), location in zip(cities, data)
+                ]
+            except Exception as e:
+                logger.error(f"Unexpected batch response: {e}")
+        
+        # Fall back to one request per city so a bad batch doesn't drop them all
+        logger.warning(f"Batch request for {len(cities)} cities failed, fetching individually")
+        return await asyncio.gather(*[
+            self._fetch_weather_data_async(http, lat, lon, name)
+            for name, lat, lon in cities
+        ])
+    
+    async def scrape_all_cities(self, cities: Sequence[City] = None) -> pd.DataFrame:
+        """
+        Scrape weather data for all cities with batched multi-location requests and return processed DataFrame
+        
+        Args:
+            cities: Sequence of City records (name, lat, lon)
                    If None, uses default cities from config
         
         Returns:
             Processed pandas DataFrame with weather data
         """
         if cities is None:
-            cities = config.CITIES
+            cities, lats, lons = config.CITIES, config.LATS, config.LONS
+        else:
+            cities = tuple(cities)
+            lats = np.array([c[1] for c in cities], dtype=np.float64)
+            lons = np.array([c[2] for c in cities], dtype=np.float64)
         
-        weather_data = []
+        # One multi-location request per BATCH_LOCATIONS cities (a single call for
+        # the default list); batches share one connection pool and run together
+        size = self.BATCH_LOCATIONS
+        async with aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=config.MAX_CONCURRENT_REQUESTS)
+        ) as http:
+            batches = await asyncio.gather(*[
+                self._fetch_batch_async(http, cities[i:i + size], lats[i:i + size], lons[i:i + size])
+                for i in range(0, len(cities), size)
+            ])
+        results = [weather for batch in batches for weather in batch]
         
-        for city_info in cities:
-            city_name = city_info['City']
-            latitude = city_info['Latitude']
-            longitude = city_info['Longitude']
-            
-            # Fetch weather data
-            weather = self.fetch_weather_data(latitude, longitude, city_name)
+        # Fill typed column arrays directly (gather keeps city order); failed
+        # fetches keep NaN readings and are dropped in one mask below
+        n = len(results)
+        city = np.empty(n, dtype=object)
+        latitude = np.empty(n, dtype=np.float64)
+        longitude = np.empty(n, dtype=np.float64)
+        temperature_c = np.full(n, np.nan, dtype=np.float64)
+        humidity = np.full(n, np.nan, dtype=np.float64)
+        wind_speed_ms = np.full(n, np.nan, dtype=np.float64)
+        timestamp = np.empty(n, dtype=object)
+        
+        for i, ((name, lat, lon), weather) in enumerate(zip(cities, results)):
+            city[i], latitude[i], longitude[i] = name, lat, lon
             if weather:
-                weather_data.append(weather)
-            
-            # Rate limiting - be respectful to the API
-            time.sleep(0.1)
+                temperature_c[i] = np.nan if weather['temperature_c'] is None else weather['temperature_c']
+                humidity[i] = np.nan if weather['humidity'] is None else weather['humidity']
+                wind_speed_ms[i] = np.nan if weather['wind_speed_ms'] is None else weather['wind_speed_ms']
+                timestamp[i] = weather['timestamp']
         
-        if not weather_data:
+        valid = ~np.isnan(temperature_c)
+        if not valid.any():
             logger.error("No weather data collected")
             return pd.DataFrame()
         
+        humidity = humidity[valid]
+        # Open-Meteo reports whole percentages; keep them integral when complete
+        # and whole (NaN fails the comparison, so gaps stay float too)
+        if np.array_equal(humidity, np.round(humidity)):
+            humidity = humidity.astype(np.int64)
+        
         # Create DataFrame
-        df = pd.DataFrame(weather_data)
+        df = pd.DataFrame({
+            'city': city[valid],
+            'latitude': latitude[valid],
+            'longitude': longitude[valid],
+            'temperature_c': temperature_c[valid],
+            'humidity': humidity,
+            'wind_speed_ms': wind_speed_ms[valid],
+            'timestamp': timestamp[valid]
+        })
         
         # Process the data
         return self.process_weather_data(df)
     
+    def scrape_all_cities_sync(self, cities: Sequence[City] = None) -> pd.DataFrame:
+        """
+        Blocking wrapper around scrape_all_cities for callers without an event loop
+        
+        Args:
+            cities: Sequence of City records, defaults to config cities
+        
+        Returns:
+            Processed pandas DataFrame with weather data
+        """
+        return asyncio.run(self.scrape_all_cities(cities))
+    
     def process_weather_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Process raw weather data with conversions and analytics
@@ -133,17 +414,29 @@ class WeatherScraper:
         
         logger.info("Processing weather data with conversions and analytics")
         
-        # Temperature conversion: Celsius to Fahrenheit
-        df['temperature_f'] = df['temperature_c'] * 9/5 + 32
+        # Frames built from raw records come in as object columns when a reading
+        # is None; make them float64 (None -> NaN) before any arithmetic
+        object_columns = [
+            column for column in ('humidity', 'latitude', 'longitude')
+            if df[column].dtype == object
+        ]
+        if object_columns:
+            df = df.astype(dict.fromkeys(object_columns, np.float64))
         
-        # Wind speed conversion: m/s to mph
-        df['wind_speed_mph'] = df['wind_speed_ms'] * 2.237
+        temperature_c = df['temperature_c'].to_numpy(dtype=np.float64)
+        wind_speed_ms = df['wind_speed_ms'].to_numpy(dtype=np.float64)
         
-        # Round values for better presentation
-        df['temperature_c'] = df['temperature_c'].round(1)
-        df['temperature_f'] = df['temperature_f'].round(1)
-        df['wind_speed_ms'] = df['wind_speed_ms'].round(1)
-        df['wind_speed_mph'] = df['wind_speed_mph'].round(1)
+        # Celsius to Fahrenheit and m/s to mph, rounded for better presentation
+        # in one pass over a stacked array
+        converted = np.round(np.stack([
+            temperature_c,
+            temperature_c * 9/5 + 32,
+            wind_speed_ms,
+            wind_speed_ms * 2.237
+        ], axis=1), 1)
+        df = df.assign(**dict(zip(
+            ['temperature_c', 'temperature_f', 'wind_speed_ms', 'wind_speed_mph'], converted.T
+        )))
         
         # Reorder columns for better readability
         column_order = [
@@ -159,6 +452,28 @@ class WeatherScraper:
         logger.info(f"Successfully processed weather data for {len(df)} cities")
         return df
     
+    def export_to_csv(self, df: pd.DataFrame, csv_path: Optional[str] = None) -> str:
+        """
+        Export weather data to CSV using the configured writer
+        
+        Args:
+            df: Processed weather DataFrame
+            csv_path: Output path, defaults to config.OUTPUT_CSV_FILE
+            
+        Returns:
+            Path of the written CSV file
+        """
+        if csv_path is None:
+            csv_path = config.OUTPUT_CSV_FILE
+        
+        if config.CSV_ENGINE == "pyarrow":
+            # C++ writer instead of pandas' per-cell Python formatting
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_path)
+        else:
+            df.to_csv(csv_path, index=False)
+        
+        return csv_path
+    
     def get_weather_insights(self, df: pd.DataFrame) -> Dict:
         """
         Generate business intelligence insights from weather data
@@ -173,24 +488,62 @@ class WeatherScraper:
         if df.empty:
             return {}
         
+        # Identical data yields identical statistics; only the timestamp is refreshed
+        key = hashlib.blake2b(
+            pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+            + repr(list(df.columns)).encode(),
+            digest_size=16
+        ).hexdigest()
+        cached = self._insights_cache.get(key)
+        if cached is None:
+            cached = self._compute_weather_insights(df)
+            self._insights_cache[key] = cached
+            while len(self._insights_cache) > self.INSIGHTS_CACHE_SIZE:
+                self._insights_cache.pop(next(iter(self._insights_cache)))
+        
+        # Fresh nested dicts so callers can't modify the cached copy
+        insights = {name: dict(value) if isinstance(value, dict) else value
+                    for name, value in cached.items()}
+        insights['data_collection_time'] = datetime.now().isoformat()
+        return insights
+    
+    def _compute_weather_insights(self, df: pd.DataFrame) -> Dict:
+        """
+        Compute the insight statistics for a non-empty DataFrame
+        
+        Args:
+            df: Processed weather DataFrame
+            
+        Returns:
+            Dictionary with key insights and statistics
+        """
+        # All averages in a single reduction
+        means = df[['temperature_c', 'temperature_f', 'humidity', 'wind_speed_mph']].mean().round(1).to_dict()
+        
+        # Extremes straight from the arrays (nan-aware, first match on ties like idxmax)
+        cities = df['city'].to_numpy()
+        temperature_c = df['temperature_c'].to_numpy(dtype=np.float64)
+        humidity = df['humidity'].to_numpy(dtype=np.float64)
+        wind_speed_mph = df['wind_speed_mph'].to_numpy(dtype=np.float64)
+        
         insights = {
             'total_cities': len(df),
             'data_collection_time': datetime.now().isoformat(),
             'temperature_stats': {
-                'hottest_city': df.loc[df['temperature_c'].idxmax(), 'city'],
-                'coldest_city': df.loc[df['temperature_c'].idxmin(), 'city'],
-                'avg_temperature_c': df['temperature_c'].mean().round(1),
-                'avg_temperature_f': df['temperature_f'].mean().round(1)
+                'hottest_city': cities[np.nanargmax(temperature_c)],
+                'coldest_city': cities[np.nanargmin(temperature_c)],
+                'avg_temperature_c': means['temperature_c'],
+                'avg_temperature_f': means['temperature_f']
             },
             'humidity_stats': {
-                'most_humid_city': df.loc[df['humidity'].idxmax(), 'city'],
-                'least_humid_city': df.loc[df['humidity'].idxmin(), 'city'],
-                'avg_humidity': df['humidity'].mean().round(1)
+                'most_humid_city': cities[np.nanargmax(humidity)],
+                'least_humid_city': cities[np.nanargmin(humidity)],
+                'avg_humidity': means['humidity']
             },
             'wind_stats': {
-                'windiest_city': df.loc[df['wind_speed_mph'].idxmax(), 'city'],
-                'calmest_city': df.loc[df['wind_speed_mph'].idxmin(), 'city'],
-                'avg_wind_speed_mph': df['wind_speed_mph'].mean().round(1)
+                'windiest_city': cities[np.nanargmax(wind_speed_mph)],
+                'calmest_city': cities[np.nanargmin(wind_speed_mph)],
+                'avg_wind_speed_mph': means['wind_speed_mph']
             }
         }
         
@@ -207,7 +560,7 @@ def main():
     scraper = WeatherScraper()
     
     # Scrape weather data
-    weather_df = scraper.scrape_all_cities()
+    weather_df = scraper.scrape_all_cities_sync()
     
     if weather_df.empty:
         print("❌ No weather data could be collected")
@@ -227,8 +580,7 @@ def main():
     print(f"• Windiest: {insights['wind_stats']['windiest_city']}")
     
     # Export to CSV
-    csv_file = config.OUTPUT_CSV_FILE
-    weather_df.to_csv(csv_file, index=False)
+    csv_file = scraper.export_to_csv(weather_df)
     print(f"\n💾 Data exported to: {csv_file}")
 
 if __name__ == "__main__":